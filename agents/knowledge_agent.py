@@ -3,13 +3,42 @@ KnowledgeAgent - Fetches external insights like weather, research, and travel in
 This agent uses APIs and search to provide contextual information for scheduling.
 """
 
-import json
+import asyncio
+import random
+import re
+import time
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+from config.settings import FROZEN_CONFIG
 from schemas.knowledge_schema import KnowledgeInsight
 from tools.tool_registry import get_tool_registry
 from tools.base_tool import ToolInput
+from utils.json_utils import safe_json_dumps, safe_json_loads
+
+# Cache TTLs in seconds - weather/traffic go stale within minutes while
+# research-backed productivity insights are effectively static
+INSIGHT_CACHE_TTL_SECONDS = 300
+RESEARCH_CACHE_TTL_SECONDS = 86400
+INSIGHT_CACHE_MAX_ENTRIES = 512
+
+# Largest API response body we will buffer; anything bigger is treated
+# as a failed fetch rather than read into memory
+MAX_RESPONSE_BYTES = 1 << 20
+
+def _dump_insights(insights: List[KnowledgeInsight], pretty: bool = False) -> str:
+    """Serialize insights to JSON in a single encoder pass.
+
+    Pydantic v1 .dict() keeps datetimes as objects; the orjson-backed
+    safe_json_dumps encodes them natively, which is the v1 equivalent of
+    model_dump(mode='json') - no per-field post-processing loop. Output is
+    compact by default; pass pretty=True for human-facing display.
+    """
+    return safe_json_dumps(
+        [insight.dict() for insight in insights],
+        indent=2 if pretty else None
+    )
 
 class KnowledgeAgent:
     """
@@ -17,6 +46,23 @@ class KnowledgeAgent:
     following KnowledgeSchema.
     """
     
+    # Tokenizer shared by all keyword routing below
+    _WORD_RE = re.compile(r'\w+')
+
+    # Handler routes checked in order; first keyword/token overlap wins
+    _ROUTES = [
+        (frozenset({'weather', 'rain', 'snow', 'temperature', 'forecast'}),
+         '_fetch_weather_insight', INSIGHT_CACHE_TTL_SECONDS),
+        (frozenset({'traffic', 'travel', 'commute', 'drive'}),
+         '_fetch_travel_insight', INSIGHT_CACHE_TTL_SECONDS),
+        (frozenset({'research', 'study', 'productivity', 'focus', 'timing'}),
+         '_fetch_research_insight', RESEARCH_CACHE_TTL_SECONDS),
+    ]
+
+    # Tool selection keywords for fetch_insights_with_tools
+    _WEATHER_TOOL_KEYWORDS = frozenset({'weather', 'rain', 'snow', 'temperature'})
+    _SEARCH_TOOL_KEYWORDS = frozenset({'search', 'research', 'information'})
+
     def __init__(self, api_keys: Optional[Dict[str, str]] = None):
         """
         Initialize KnowledgeAgent with API keys and ADK tools.
@@ -39,39 +85,179 @@ class KnowledgeAgent:
         # Legacy API endpoints for backward compatibility
         self.weather_api_url = "https://api.openweathermap.org/data/2.5/weather"
         self.search_api_url = "https://www.googleapis.com/customsearch/v1"
-    
-    def fetch_insights(
-        self, 
-        queries: List[str], 
+
+        # Shared HTTP session with connection pooling - keep-alive sockets are
+        # reused across calls instead of paying a TCP+TLS handshake per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # TTL cache of resolved insights keyed by (handler, query, location)
+        self._insight_cache: Dict[str, Any] = {}
+
+    def _http_get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Fetch JSON over the pooled session with a bounded read.
+
+        The body is read off the raw stream with a MAX_RESPONSE_BYTES cap
+        (rejecting early when Content-Length already exceeds it), so a
+        misbehaving upstream can't balloon memory; the connection is
+        released back to the pool when parsing is done.
+        """
+        response = self.session.get(url, params=params, timeout=5, stream=True)
+        with response:
+            response.raise_for_status()
+            length = response.headers.get('Content-Length')
+            if length is not None and int(length) > MAX_RESPONSE_BYTES:
+                raise requests.RequestException(
+                    f"Response too large ({length} bytes) from {url}"
+                )
+            body = response.raw.read(MAX_RESPONSE_BYTES + 1, decode_content=True)
+            if len(body) > MAX_RESPONSE_BYTES:
+                raise requests.RequestException(
+                    f"Response exceeded {MAX_RESPONSE_BYTES} bytes from {url}"
+                )
+            return safe_json_loads(body)
+
+    def close(self):
+        """Close the shared HTTP session and release pooled connections."""
+        self.session.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def fetch_insights_dict(
+        self,
+        queries: List[str],
         location: Optional[str] = None,
         task_context: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch external insights as Python objects for in-process callers.
+
+        Args:
+            queries: List of queries to search for
+            location: User location for weather/local info
+            task_context: Context about tasks that need insights
+
+        Returns:
+            List of KnowledgeInsight dictionaries
+        """
+        try:
+            insights = asyncio.run(self._gather_insights(queries, location, task_context))
+        except RuntimeError:
+            # Already inside an event loop - fall back to sequential processing
+            insights = [
+                self._process_single_query(query, location, task_context)
+                for query in queries
+            ]
+
+        return [insight.dict() for insight in insights]
+
+    def fetch_insights(
+        self,
+        queries: List[str],
+        location: Optional[str] = None,
+        task_context: Optional[List[Dict[str, Any]]] = None,
+        pretty: bool = False
     ) -> str:
         """
         Main method to fetch external insights.
-        
+
         Args:
             queries: List of queries to search for
             location: User location for weather/local info
             task_context: Context about tasks that need insights
-            
+            pretty: Indent output for human display (compact by default)
+
+        Returns:
+            JSON string with list of KnowledgeInsight objects
+        """
+        return safe_json_dumps(
+            self.fetch_insights_dict(queries, location, task_context),
+            indent=2 if pretty else None
+        )
+
+    async def fetch_insights_async(
+        self,
+        queries: List[str],
+        location: Optional[str] = None,
+        task_context: Optional[List[Dict[str, Any]]] = None,
+        pretty: bool = False
+    ) -> str:
+        """
+        Async variant of fetch_insights that fans out all queries concurrently.
+
+        Args:
+            queries: List of queries to search for
+            location: User location for weather/local info
+            task_context: Context about tasks that need insights
+
         Returns:
             JSON string with list of KnowledgeInsight objects
         """
+        insights = await self._gather_insights(queries, location, task_context)
+
+        return _dump_insights(insights, pretty)
+
+    async def _gather_insights(
+        self,
+        queries: List[str],
+        location: Optional[str] = None,
+        task_context: Optional[List[Dict[str, Any]]] = None
+    ) -> List[KnowledgeInsight]:
+        """Run all per-query handlers concurrently and collect their insights.
+
+        In-flight queries are capped at the shared batch.max_concurrency
+        limit so a plan with many knowledge needs cannot stampede the
+        external APIs.
+        """
+        semaphore = asyncio.Semaphore(FROZEN_CONFIG['batch']['max_concurrency'])
+
+        async def _bounded(query: str) -> KnowledgeInsight:
+            async with semaphore:
+                return await self._process_single_query_async(query, location, task_context)
+
+        tasks = [_bounded(query) for query in queries]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
         insights = []
-        
-        for query in queries:
-            insight = self._process_single_query(query, location, task_context)
-            insights.append(insight)
-        
-        insights_data = []
-        for insight in insights:
-            insight_dict = insight.dict()
-            insight_dict['retrieved_at'] = insight_dict['retrieved_at'].isoformat()
-            insights_data.append(insight_dict)
-        
-        return json.dumps(insights_data, indent=2)
-    
-    def fetch_insights_with_tools(self, queries: List[str], location: Optional[str] = None) -> str:
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                # Mirror the per-handler fallback: degrade to a low-confidence insight
+                insights.append(KnowledgeInsight(
+                    query=query,
+                    summary=None,
+                    source=None,
+                    confidence="low",
+                    suggested_schedule_impact=None,
+                    retrieved_at=datetime.now()
+                ))
+            else:
+                insights.append(result)
+
+        return insights
+
+    async def _process_single_query_async(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        task_context: Optional[List[Dict[str, Any]]] = None
+    ) -> KnowledgeInsight:
+        """Process a single query off the event loop so I/O-bound handlers overlap."""
+        return await asyncio.to_thread(
+            self._process_single_query, query, location, task_context
+        )
+
+    def fetch_insights_with_tools(self, queries: List[str], location: Optional[str] = None, pretty: bool = False) -> str:
         """
         Enhanced insight fetching using ADK tools.
         
@@ -82,72 +268,170 @@ class KnowledgeAgent:
         Returns:
             JSON string with enhanced insights from ADK tools
         """
-        enhanced_insights = []
-        
-        for query in queries:
-            query_lower = query.lower()
-            
-            # Use appropriate ADK tool based on query type
-            if any(word in query_lower for word in ['weather', 'rain', 'snow', 'temperature']):
-                weather_tool = self.tool_registry.get_tool('weather_service')
-                if weather_tool:
-                    tool_input = ToolInput(
-                        query="current weather",
-                        parameters={'location': location or 'New York'}
-                    )
-                    result = weather_tool.execute(tool_input)
-                    
-                    if result.success and result.result:
-                        weather_data = result.result.get('weather', {})
-                        recommendations = result.result.get('scheduling_recommendations', [])
-                        
-                        insight = KnowledgeInsight(
-                            query=query,
-                            summary=f"{weather_data.get('condition', 'N/A')}, {weather_data.get('temperature', 'N/A')}°F",
-                            source="ADK Weather Tool",
-                            confidence="high",
-                            suggested_schedule_impact="; ".join(recommendations[:2]) if recommendations else None,
-                            retrieved_at=datetime.now()
-                        )
-                        enhanced_insights.append(insight.dict())
-                        continue
-            
-            elif any(word in query_lower for word in ['search', 'research', 'information']):
-                search_tool = self.tool_registry.get_tool('google_search')
-                if search_tool:
-                    tool_input = ToolInput(
-                        query=query,
-                        parameters={'num_results': 3}
-                    )
-                    result = search_tool.execute(tool_input)
-                    
-                    if result.success and result.result:
-                        search_results = result.result
-                        if search_results:
-                            summary = search_results[0].get('snippet', '')[:40] + "..." if search_results[0].get('snippet') else "Search results available"
-                            
-                            insight = KnowledgeInsight(
-                                query=query,
-                                summary=summary,
-                                source="ADK Search Tool",
-                                confidence="high",
-                                suggested_schedule_impact=None,
-                                retrieved_at=datetime.now()
-                            )
-                            enhanced_insights.append(insight.dict())
-                            continue
-            
-            # Fallback to original processing
-            original_insight = self._process_single_query(query, location)
-            enhanced_insights.append(original_insight.dict())
-        
-        # Convert datetime objects for JSON serialization
-        for insight in enhanced_insights:
-            if 'retrieved_at' in insight:
-                insight['retrieved_at'] = insight['retrieved_at'].isoformat() if hasattr(insight['retrieved_at'], 'isoformat') else insight['retrieved_at']
-        
-        return json.dumps(enhanced_insights, indent=2)
-    
+        enhanced_insights: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+
+        weather_tool, search_tool, weather_indices, search_indices = \
+            self._bucket_queries_by_tool(queries)
+
+        if weather_indices:
+            results = weather_tool.execute_batch(
+                self._weather_batch_inputs(weather_indices, location)
+            )
+            self._apply_weather_results(queries, weather_indices, results, enhanced_insights)
+
+        if search_indices:
+            results = search_tool.execute_batch(
+                self._search_batch_inputs(queries, search_indices)
+            )
+            self._apply_search_results(queries, search_indices, results, enhanced_insights)
+
+        # Fallback to original processing for anything a tool didn't answer
+        for i, query in enumerate(queries):
+            if enhanced_insights[i] is None:
+                enhanced_insights[i] = self._process_single_query(query, location).dict()
+
+        return safe_json_dumps(enhanced_insights, indent=2 if pretty else None)
+
+    async def fetch_insights_with_tools_async(self, queries: List[str], location: Optional[str] = None, pretty: bool = False) -> str:
+        """
+        Async variant of fetch_insights_with_tools.
+
+        The batched weather and search tool calls run in worker threads and
+        overlap via asyncio.gather, as do the per-query fallbacks, so total
+        latency is bounded by the slowest tool rather than their sum.
+
+        Args:
+            queries: List of queries to search for
+            location: User location for weather/local info
+
+        Returns:
+            JSON string with enhanced insights from ADK tools
+        """
+        enhanced_insights: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+
+        weather_tool, search_tool, weather_indices, search_indices = \
+            self._bucket_queries_by_tool(queries)
+
+        batch_calls = []
+        if weather_indices:
+            batch_calls.append(asyncio.to_thread(
+                weather_tool.execute_batch,
+                self._weather_batch_inputs(weather_indices, location)
+            ))
+        if search_indices:
+            batch_calls.append(asyncio.to_thread(
+                search_tool.execute_batch,
+                self._search_batch_inputs(queries, search_indices)
+            ))
+
+        if batch_calls:
+            batch_results = await asyncio.gather(*batch_calls)
+            if weather_indices:
+                self._apply_weather_results(
+                    queries, weather_indices, batch_results.pop(0), enhanced_insights
+                )
+            if search_indices:
+                self._apply_search_results(
+                    queries, search_indices, batch_results.pop(0), enhanced_insights
+                )
+
+        # Fallback to original processing for anything a tool didn't answer
+        fallback_indices = [i for i, insight in enumerate(enhanced_insights) if insight is None]
+        if fallback_indices:
+            fallback_insights = await asyncio.gather(*[
+                self._process_single_query_async(queries[i], location)
+                for i in fallback_indices
+            ])
+            for i, insight in zip(fallback_indices, fallback_insights):
+                enhanced_insights[i] = insight.dict()
+
+        return safe_json_dumps(enhanced_insights, indent=2 if pretty else None)
+
+    def _bucket_queries_by_tool(self, queries: List[str]):
+        """
+        Bucket query indices by the tool that should answer them.
+
+        Returns:
+            Tuple of (weather_tool, search_tool, weather_indices, search_indices)
+        """
+        weather_tool = self.tool_registry.get_tool('weather_service')
+        search_tool = self.tool_registry.get_tool('google_search')
+
+        weather_indices = []
+        search_indices = []
+        for i, query in enumerate(queries):
+            tokens = frozenset(self._WORD_RE.findall(query.lower()))
+
+            if weather_tool and not self._WEATHER_TOOL_KEYWORDS.isdisjoint(tokens):
+                weather_indices.append(i)
+            elif search_tool and not self._SEARCH_TOOL_KEYWORDS.isdisjoint(tokens):
+                search_indices.append(i)
+
+        return weather_tool, search_tool, weather_indices, search_indices
+
+    def _weather_batch_inputs(self, indices: List[int], location: Optional[str]) -> List[ToolInput]:
+        """Build the weather tool inputs for a bucket of query indices."""
+        return [
+            ToolInput(
+                query="current weather",
+                parameters={'location': location or 'New York'}
+            )
+            for _ in indices
+        ]
+
+    def _search_batch_inputs(self, queries: List[str], indices: List[int]) -> List[ToolInput]:
+        """Build the search tool inputs for a bucket of query indices."""
+        return [
+            ToolInput(query=queries[i], parameters={'num_results': 3})
+            for i in indices
+        ]
+
+    def _apply_weather_results(
+        self,
+        queries: List[str],
+        indices: List[int],
+        results: List[Any],
+        enhanced_insights: List[Optional[Dict[str, Any]]]
+    ):
+        """Convert weather tool outputs into insight dicts at their query slots."""
+        for i, result in zip(indices, results):
+            if result.success and result.result:
+                weather_data = result.result.get('weather', {})
+                recommendations = result.result.get('scheduling_recommendations', [])
+
+                insight = KnowledgeInsight(
+                    query=queries[i],
+                    summary=f"{weather_data.get('condition', 'N/A')}, {weather_data.get('temperature', 'N/A')}°F",
+                    source="ADK Weather Tool",
+                    confidence="high",
+                    suggested_schedule_impact="; ".join(recommendations[:2]) if recommendations else None,
+                    retrieved_at=datetime.now()
+                )
+                enhanced_insights[i] = insight.dict()
+
+    def _apply_search_results(
+        self,
+        queries: List[str],
+        indices: List[int],
+        results: List[Any],
+        enhanced_insights: List[Optional[Dict[str, Any]]]
+    ):
+        """Convert search tool outputs into insight dicts at their query slots."""
+        for i, result in zip(indices, results):
+            if result.success and result.result:
+                search_results = result.result
+                summary = search_results[0].get('snippet', '')[:40] + "..." if search_results[0].get('snippet') else "Search results available"
+
+                insight = KnowledgeInsight(
+                    query=queries[i],
+                    summary=summary,
+                    source="ADK Search Tool",
+                    confidence="high",
+                    suggested_schedule_impact=None,
+                    retrieved_at=datetime.now()
+                )
+                enhanced_insights[i] = insight.dict()
+
     def _process_single_query(
         self, 
         query: str, 
@@ -166,17 +450,59 @@ class KnowledgeAgent:
             KnowledgeInsight object
         """
         query_lower = query.lower()
-        
-        # Determine query type and route to appropriate handler
-        if any(word in query_lower for word in ['weather', 'rain', 'snow', 'temperature', 'forecast']):
-            return self._fetch_weather_insight(query, location)
-        elif any(word in query_lower for word in ['traffic', 'travel', 'commute', 'drive']):
-            return self._fetch_travel_insight(query, location)
-        elif any(word in query_lower for word in ['research', 'study', 'productivity', 'focus', 'timing']):
-            return self._fetch_research_insight(query)
+
+        # Route on token-set intersection - one tokenize pass per query
+        # instead of repeated substring scans per keyword list
+        tokens = frozenset(self._WORD_RE.findall(query_lower))
+        for keywords, handler, ttl in self._ROUTES:
+            if not keywords.isdisjoint(tokens):
+                break
         else:
-            return self._fetch_general_insight(query)
-    
+            handler, ttl = '_fetch_general_insight', INSIGHT_CACHE_TTL_SECONDS
+
+        # Serve repeat queries from the TTL cache instead of re-fetching
+        cache_key = f"{handler}|{query_lower.strip()}|{location or ''}"
+        cached = self._get_cached_insight(cache_key)
+        if cached is not None:
+            return cached
+
+        if handler in ('_fetch_weather_insight', '_fetch_travel_insight'):
+            insight = getattr(self, handler)(query, location)
+        else:
+            insight = getattr(self, handler)(query)
+
+        # Only memoize successful lookups so failures are retried next tick
+        if insight.summary is not None:
+            self._store_cached_insight(cache_key, insight, ttl)
+
+        return insight
+
+    def _get_cached_insight(self, cache_key: str) -> Optional[KnowledgeInsight]:
+        """Return a cached insight if present and not expired."""
+        entry = self._insight_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        expires_at, insight = entry
+        if time.monotonic() >= expires_at:
+            del self._insight_cache[cache_key]
+            return None
+
+        return insight
+
+    def _store_cached_insight(self, cache_key: str, insight: KnowledgeInsight, ttl_seconds: int):
+        """Store an insight in the TTL cache, evicting expired entries when full."""
+        if len(self._insight_cache) >= INSIGHT_CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            self._insight_cache = {
+                key: entry for key, entry in self._insight_cache.items()
+                if entry[0] > now
+            }
+            if len(self._insight_cache) >= INSIGHT_CACHE_MAX_ENTRIES:
+                self._insight_cache.clear()
+
+        self._insight_cache[cache_key] = (time.monotonic() + ttl_seconds, insight)
+
     def _fetch_weather_insight(self, query: str, location: Optional[str] = None) -> KnowledgeInsight:
         """
         Fetch weather information.
@@ -191,9 +517,23 @@ class KnowledgeAgent:
         try:
             if not location:
                 location = "New York"  # Default location
-            
-            # Mock weather data (in real implementation, use actual API)
-            weather_data = self._get_mock_weather_data(location)
+
+            api_key = self.api_keys.get('weather_api_key')
+            if api_key:
+                data = self._http_get_json(self.weather_api_url, params={
+                    'q': location,
+                    'appid': api_key,
+                    'units': 'imperial'
+                })
+                weather_data = {
+                    'condition': data['weather'][0]['description'],
+                    'temp': data['main']['temp'],
+                    'humidity': data['main']['humidity'],
+                    'location': location
+                }
+            else:
+                # No API key configured - use mock weather data
+                weather_data = self._get_mock_weather_data(location)
             
             if weather_data:
                 summary = f"{weather_data['condition']}, {weather_data['temp']}°F, {weather_data['humidity']}% humidity"
@@ -377,8 +717,6 @@ class KnowledgeAgent:
         Generate mock weather data for demonstration.
         In real implementation, this would call actual weather API.
         """
-        import random
-        
         conditions = ["Sunny", "Partly Cloudy", "Cloudy", "Light Rain", "Heavy Rain", "Snow"]
         
         return {
@@ -393,8 +731,6 @@ class KnowledgeAgent:
         Generate mock traffic data for demonstration.
         In real implementation, this would call actual traffic API.
         """
-        import random
-        
         conditions = ["Light", "Moderate", "Heavy", "Very Heavy"]
         
         return {
@@ -406,7 +742,8 @@ class KnowledgeAgent:
     def get_weather_for_tasks(
         self, 
         tasks: List[Dict[str, Any]], 
-        location: Optional[str] = None
+        location: Optional[str] = None,
+        pretty: bool = False
     ) -> str:
         """
         Get weather insights specifically for outdoor tasks.
@@ -424,13 +761,16 @@ class KnowledgeAgent:
         ]
         
         if not outdoor_tasks:
-            return json.dumps([], indent=2)
+            return safe_json_dumps([], indent=2 if pretty else None)
         
-        return self.fetch_insights(["weather forecast for outdoor activities"], location, outdoor_tasks)
+        return self.fetch_insights(
+            ["weather forecast for outdoor activities"], location, outdoor_tasks, pretty=pretty
+        )
     
     def get_productivity_insights(
         self, 
-        task_types: List[str]
+        task_types: List[str],
+        pretty: bool = False
     ) -> str:
         """
         Get research-backed productivity insights for specific task types.
@@ -442,7 +782,7 @@ class KnowledgeAgent:
             JSON string with productivity insights
         """
         queries = [f"best timing for {task_type} tasks" for task_type in task_types]
-        return self.fetch_insights(queries)
+        return self.fetch_insights(queries, pretty=pretty)
     
     def get_tool_usage_statistics(self) -> Dict[str, Any]:
         """
@@ -4,9 +4,64 @@ This agent checks schedules and generates timely notifications.
 """
 
 import json
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Literal
 from schemas.reminder_schema import ReminderResponse, Alert, OverdueTask, ReminderMeta
+from utils.helpers import slugify
+from utils.json_utils import safe_json_dumps
+
+@lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp, memoized across reminder ticks.
+
+    Schedules change rarely between ticks, so the same block timestamps are
+    parsed over and over; caching turns repeat parses into a dict lookup.
+    """
+    if timestamp.endswith('Z'):
+        timestamp = timestamp[:-1] + '+00:00'
+    return datetime.fromisoformat(timestamp)
+
+@lru_cache(maxsize=2)
+def _date_stamp(day) -> str:
+    """Format a date as YYYYMMDD, cached so repeat calls skip strftime."""
+    return day.strftime('%Y%m%d')
+
+@lru_cache(maxsize=256)
+def _overdue_reason(days_overdue: int) -> str:
+    """Generate a reason for why a task is overdue."""
+    if days_overdue == 0:
+        return "Due date was today"
+    elif days_overdue == 1:
+        return "Due date was yesterday"
+    elif days_overdue <= 7:
+        return f"Due date was {days_overdue} days ago"
+    elif days_overdue <= 30:
+        return f"Due date was {days_overdue // 7} weeks ago"
+    else:
+        return f"Due date was {days_overdue // 30} months ago"
+
+@lru_cache(maxsize=256)
+def _overdue_recommendation(priority: str, days_overdue: int) -> str:
+    """Generate a recommendation for handling overdue tasks."""
+    if days_overdue <= 1:
+        if priority == 'high':
+            return "Reschedule immediately to today"
+        else:
+            return "Reschedule to tomorrow or mark as done if completed"
+    elif days_overdue <= 7:
+        if priority == 'high':
+            return "Urgent: Reschedule to today or next available slot"
+        elif priority == 'medium':
+            return "Reschedule to this week or evaluate if still needed"
+        else:
+            return "Consider if this task is still relevant or can be cancelled"
+    else:
+        return "Evaluate if this task is still needed, consider marking as cancelled"
 
 class ReminderAgent:
     """
@@ -17,78 +72,92 @@ class ReminderAgent:
     def __init__(self):
         """Initialize ReminderAgent with system prompt behavior."""
         self.system_prompt = """You are ReminderAgent. Check schedule and tasks. Output alerts as JSON using the ReminderSchema. Only JSON."""
-        self.alert_history = {}  # Track sent alerts to avoid duplicates
+        # Track sent alerts to avoid duplicates: a monotonic timestamp per
+        # alert id plus an expiry queue for amortized O(1) 24h eviction
+        self._alert_times: Dict[str, float] = {}
+        self._alert_expiry: deque = deque()
+
+        # Cached start-time index over the last seen blocks list
+        self._indexed_blocks = None
+        self._indexed_len = -1
+        self._index_starts: List[datetime] = []
+        self._index_entries: List[Any] = []
     
-    def check_reminders(
-        self, 
-        schedule: Dict[str, Any], 
-        tasks: List[Dict[str, Any]], 
+    def check_reminders_dict(
+        self,
+        schedule: Dict[str, Any],
+        tasks: List[Dict[str, Any]],
         preferences: Optional[Dict[str, Any]] = None,
         current_time: Optional[datetime] = None
-    ) -> str:
+    ) -> Dict[str, Any]:
         """
-        Main method to check for reminders and alerts.
-        
+        Check for reminders and alerts, returned as a Python dict.
+
         Args:
             schedule: Current schedule dictionary
             tasks: List of all tasks
             preferences: User preferences (alert_window_minutes, etc.)
             current_time: Current time (for testing, defaults to now)
-            
+
         Returns:
-            JSON string matching ReminderSchema
+            Dictionary matching ReminderSchema
         """
         try:
             if current_time is None:
                 current_time = datetime.now()
-            
+
             if preferences is None:
                 preferences = {"alert_window_minutes": 60}
-            
+
             alert_window = preferences.get('alert_window_minutes', 60)
-            
+
             # Check for upcoming tasks (alerts)
             alerts = self._check_upcoming_tasks(schedule, current_time, alert_window)
-            
+
             # Check for overdue tasks
             overdue = self._check_overdue_tasks(tasks, current_time)
-            
+
             # Create response
             response = ReminderResponse(
                 alerts=alerts,
                 overdue=overdue,
                 meta=ReminderMeta(tick_time=current_time)
             )
-            
-            # Convert datetime objects manually for JSON serialization
-            response_dict = response.dict()
-            
-            # Convert alert datetime objects
-            for alert in response_dict.get('alerts', []):
-                if isinstance(alert.get('start_time'), datetime):
-                    alert['start_time'] = alert['start_time'].isoformat()
-            
-            # Convert overdue datetime objects
-            for overdue in response_dict.get('overdue', []):
-                if isinstance(overdue.get('due_date'), datetime):
-                    overdue['due_date'] = overdue['due_date'].isoformat()
-            
-            # Convert meta datetime
-            if isinstance(response_dict.get('meta', {}).get('tick_time'), datetime):
-                response_dict['meta']['tick_time'] = response_dict['meta']['tick_time'].isoformat()
-            
-            return json.dumps(response_dict, indent=2)
-            
+
+            return response.dict()
+
         except Exception as e:
             # Fallback response
-            fallback = {
+            return {
                 "alerts": [],
                 "overdue": [],
                 "meta": {
                     "tick_time": current_time.isoformat() if current_time else datetime.now().isoformat()
                 }
             }
-            return json.dumps(fallback, indent=2)
+
+    def check_reminders(
+        self,
+        schedule: Dict[str, Any],
+        tasks: List[Dict[str, Any]],
+        preferences: Optional[Dict[str, Any]] = None,
+        current_time: Optional[datetime] = None,
+        pretty: bool = False
+    ) -> str:
+        """
+        Main method to check for reminders and alerts.
+
+        Same arguments as check_reminders_dict, plus pretty to indent the
+        output for human display (compact by default).
+
+        Returns:
+            JSON string matching ReminderSchema
+        """
+        # safe_json_dumps encodes the datetimes from .dict() natively
+        return safe_json_dumps(
+            self.check_reminders_dict(schedule, tasks, preferences, current_time),
+            indent=2 if pretty else None
+        )
     
     def _check_upcoming_tasks(
         self, 
@@ -103,38 +172,74 @@ class ReminderAgent:
             return alerts
         
         alert_cutoff = current_time + timedelta(minutes=alert_window_minutes)
-        
-        for block in schedule['blocks']:
+
+        # Slice only the blocks inside [now, now + window] via bisect instead
+        # of scanning the whole schedule every tick
+        starts, entries = self._get_block_index(schedule['blocks'])
+        lo = bisect_left(starts, current_time)
+        hi = bisect_right(starts, alert_cutoff)
+
+        for start_time, block in entries[lo:hi]:
             try:
-                start_time = datetime.fromisoformat(block['start'])
-                
-                # Check if task starts within alert window
-                if current_time <= start_time <= alert_cutoff:
-                    minutes_until = int((start_time - current_time).total_seconds() // 60)
-                    
-                    # Generate unique alert ID
-                    alert_id = f"{block['task_id']}-{start_time.strftime('%H%M')}"
-                    
-                    # Check if we've already alerted for this task (idempotent alerts)
-                    if self._should_send_alert(alert_id, start_time):
-                        alert = Alert(
-                            alert_id=alert_id,
-                            task_id=block['task_id'],
-                            task_title=block['task_title'],
-                            start_time=start_time,
-                            minutes_until_start=minutes_until,
-                            actions=self._get_available_actions(minutes_until)
-                        )
-                        
-                        alerts.append(alert)
-                        self._record_alert(alert_id, start_time)
-            
+                minutes_until = int((start_time - current_time).total_seconds() // 60)
+
+                # Generate unique alert ID
+                alert_id = f"{block['task_id']}-{start_time.strftime('%H%M')}"
+
+                # Check if we've already alerted for this task (idempotent alerts)
+                if self._should_send_alert(alert_id, start_time):
+                    # Fields are built here, not user input - construct()
+                    # skips per-field validation in the hot loop
+                    alert = Alert.construct(
+                        alert_id=alert_id,
+                        task_id=block['task_id'],
+                        task_title=block['task_title'],
+                        start_time=start_time,
+                        minutes_until_start=minutes_until,
+                        actions=self._get_available_actions(minutes_until)
+                    )
+
+                    alerts.append(alert)
+                    self._record_alert(alert_id, start_time)
+
             except (ValueError, KeyError) as e:
                 # Skip malformed blocks
                 continue
-        
+
         return alerts
-    
+
+    def _get_block_index(self, blocks: List[Dict[str, Any]]):
+        """
+        Return (sorted_starts, [(start, block), ...]) for a blocks list.
+
+        The index is cached against the last seen list so repeat ticks over an
+        unchanged schedule skip the parse-and-sort entirely. Blocks with
+        missing or malformed start times are dropped, matching the previous
+        skip-on-error behavior.
+        """
+        if blocks is self._indexed_blocks and len(blocks) == self._indexed_len:
+            return self._index_starts, self._index_entries
+
+        entries = []
+        for block in blocks:
+            try:
+                # In-process schedules carry datetime objects; persisted
+                # ones carry ISO strings
+                start = block['start']
+                if not isinstance(start, datetime):
+                    start = _parse_iso(start)
+                entries.append((start, block))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
+        entries.sort(key=lambda entry: entry[0])
+
+        self._indexed_blocks = blocks
+        self._indexed_len = len(blocks)
+        self._index_entries = entries
+        self._index_starts = [entry[0] for entry in entries]
+
+        return self._index_starts, self._index_entries
+
     def _check_overdue_tasks(
         self, 
         tasks: List[Dict[str, Any]], 
@@ -149,13 +254,13 @@ class ReminderAgent:
                 continue
             
             try:
-                due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
+                due_date = _parse_iso(due_date_str)
                 
                 if due_date < current_time:
                     # Task is overdue
                     days_overdue = (current_time - due_date).days
                     
-                    overdue_task = OverdueTask(
+                    overdue_task = OverdueTask.construct(
                         task_id=self._generate_task_id(task),
                         task_title=task.get('title', 'Untitled Task'),
                         due_date=due_date,
@@ -173,79 +278,62 @@ class ReminderAgent:
     
     def _should_send_alert(self, alert_id: str, start_time: datetime) -> bool:
         """Check if we should send an alert (idempotent behavior)."""
-        # Only alert once per task per window
-        if alert_id in self.alert_history:
-            last_alert_time = self.alert_history[alert_id]
-            # Don't alert again within 30 minutes
-            if (datetime.now() - last_alert_time).total_seconds() < 1800:
-                return False
-        
+        # Only alert once per task per window - don't alert again within 30 min
+        last_alert_time = self._alert_times.get(alert_id)
+        if last_alert_time is not None and time.monotonic() - last_alert_time < 1800:
+            return False
+
         return True
-    
+
     def _record_alert(self, alert_id: str, start_time: datetime):
         """Record that we sent an alert for this task."""
-        self.alert_history[alert_id] = datetime.now()
-        
-        # Clean up old alerts (older than 24 hours)
-        cutoff = datetime.now() - timedelta(hours=24)
-        self.alert_history = {
-            k: v for k, v in self.alert_history.items() 
-            if v > cutoff
-        }
+        now = time.monotonic()
+        self._alert_times[alert_id] = now
+        self._alert_expiry.append((now, alert_id))
+
+        # Evict alerts older than 24 hours from the left of the queue
+        cutoff = now - 86400
+        while self._alert_expiry and self._alert_expiry[0][0] < cutoff:
+            recorded_at, expired_id = self._alert_expiry.popleft()
+            # Only drop the entry if it wasn't refreshed by a later alert
+            if self._alert_times.get(expired_id) == recorded_at:
+                del self._alert_times[expired_id]
     
 
     
     def _generate_task_id(self, task: Dict[str, Any]) -> str:
         """Generate a task ID for tasks that don't have one."""
-        title = task.get('title', 'task')
-        # Create a slug from the title
-        slug = title.lower().replace(' ', '-').replace('_', '-')
-        slug = ''.join(c for c in slug if c.isalnum() or c == '-')[:20]
-        return f"{slug}-{datetime.now().strftime('%Y%m%d')}"
+        return f"{slugify(task.get('title', 'task'))}-{_date_stamp(datetime.now().date())}"
     
     def _get_overdue_reason(self, days_overdue: int) -> str:
         """Generate a reason for why a task is overdue."""
-        if days_overdue == 0:
-            return "Due date was today"
-        elif days_overdue == 1:
-            return "Due date was yesterday"
-        elif days_overdue <= 7:
-            return f"Due date was {days_overdue} days ago"
-        elif days_overdue <= 30:
-            return f"Due date was {days_overdue // 7} weeks ago"
-        else:
-            return f"Due date was {days_overdue // 30} months ago"
-    
+        return _overdue_reason(days_overdue)
+
     def _get_overdue_recommendation(self, task: Dict[str, Any], days_overdue: int) -> str:
         """Generate a recommendation for handling overdue tasks."""
-        priority = task.get('priority', 'medium')
-        
-        if days_overdue <= 1:
-            if priority == 'high':
-                return "Reschedule immediately to today"
-            else:
-                return "Reschedule to tomorrow or mark as done if completed"
-        elif days_overdue <= 7:
-            if priority == 'high':
-                return "Urgent: Reschedule to today or next available slot"
-            elif priority == 'medium':
-                return "Reschedule to this week or evaluate if still needed"
-            else:
-                return "Consider if this task is still relevant or can be cancelled"
-        else:
-            return "Evaluate if this task is still needed, consider marking as cancelled"
+        return _overdue_recommendation(task.get('priority', 'medium'), days_overdue)
     
     def process_reminder_tick(
-        self, 
-        schedule: Dict[str, Any], 
-        tasks: List[Dict[str, Any]], 
-        preferences: Optional[Dict[str, Any]] = None
+        self,
+        schedule: Dict[str, Any],
+        tasks: List[Dict[str, Any]],
+        preferences: Optional[Dict[str, Any]] = None,
+        pretty: bool = False
     ) -> str:
         """
         Process a reminder tick (periodic check).
         This is the main entry point following the system prompt.
         """
-        return self.check_reminders(schedule, tasks, preferences)
+        return self.check_reminders(schedule, tasks, preferences, pretty=pretty)
+
+    def process_reminder_tick_dict(
+        self,
+        schedule: Dict[str, Any],
+        tasks: List[Dict[str, Any]],
+        preferences: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Dict-returning variant of process_reminder_tick for in-process callers."""
+        return self.check_reminders_dict(schedule, tasks, preferences)
     
     def _get_available_actions(self, minutes_until: int) -> List[Literal["snooze 10", "reschedule 30", "mark_done"]]:
         """Get available actions based on minutes until task start."""
@@ -3,11 +3,56 @@ SchedulePlanner Agent - Generates conflict-free daily schedules.
 This agent creates time blocks, respects user preferences, and handles task splitting.
 """
 
-import json
+import re
+from bisect import bisect_left
 from datetime import datetime, timedelta, time, date
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Optional
 from schemas.task_schema import Task
 from schemas.schedule_schema import DailySchedule, ScheduleBlock, UnscheduledTask
+from utils.helpers import slugify
+from utils.json_utils import safe_json_dumps
+
+# Slot arithmetic runs on integer minutes since this epoch; datetimes are
+# built only when a block is emitted or an insight needs wall-clock text
+_EPOCH = datetime(1970, 1, 1)
+_MINUTE = timedelta(minutes=1)
+
+def _to_minutes(dt: datetime) -> int:
+    """Convert a datetime to whole minutes since the module epoch."""
+    return (dt - _EPOCH) // _MINUTE
+
+def _from_minutes(minutes: int) -> datetime:
+    """Convert minutes since the module epoch back to a datetime."""
+    return _EPOCH + minutes * _MINUTE
+
+_WORD_RE = re.compile(r'\w+')
+_TIME_RE = re.compile(r'\d{2}:\d{2}')
+
+@lru_cache(maxsize=4096)
+def _due_timestamp(due_date: str) -> float:
+    """
+    Parse a due date to a sortable timestamp; unparseable sorts last.
+
+    Cached so re-planning the same task set skips the fromisoformat work,
+    and the exception path only ever fires once per malformed string.
+    """
+    try:
+        if due_date.endswith('Z'):
+            due_date = due_date[:-1] + '+00:00'
+        return datetime.fromisoformat(due_date).timestamp()
+    except Exception:
+        return float('inf')
+
+@lru_cache(maxsize=8)
+def _work_hour_times(start_str: str, end_str: str):
+    """
+    Parse work-hour strings to time objects, cached per distinct pair.
+
+    Preferences rarely change between scheduling calls, so multi-day
+    planning reuses the parsed pair instead of re-running fromisoformat.
+    """
+    return time.fromisoformat(start_str), time.fromisoformat(end_str)
 
 class SchedulePlanner:
     """
@@ -19,18 +64,18 @@ class SchedulePlanner:
         """Initialize SchedulePlanner with system prompt behavior."""
         self.system_prompt = """You are SchedulePlanner — produce a conflict-free schedule as JSON using the ScheduleSchema. Split tasks into subtasks using preferred_focus_minutes. Respect working_hours, blocked_times. If a task cannot fit, add it to `unscheduled` with a reason."""
     
-    def create_schedule(
-        self, 
-        tasks: List[Dict[str, Any]], 
-        preferences: Dict[str, Any], 
-        blocked_times: List[Dict[str, Any]], 
+    def create_schedule_dict(
+        self,
+        tasks: List[Dict[str, Any]],
+        preferences: Dict[str, Any],
+        blocked_times: List[Dict[str, Any]],
         knowledge_insights: Optional[List[Dict[str, Any]]] = None,
         target_date: Optional[str] = None,
         timezone: str = "UTC"
-    ) -> str:
+    ) -> Dict[str, Any]:
         """
-        Main method to create a daily schedule.
-        
+        Create a daily schedule as a Python dict for in-process callers.
+
         Args:
             tasks: List of task dictionaries
             preferences: User preferences (work_hours, preferred_focus_minutes, etc.)
@@ -38,9 +83,9 @@ class SchedulePlanner:
             knowledge_insights: External insights that might affect scheduling
             target_date: Date to schedule for (YYYY-MM-DD format)
             timezone: Timezone for the schedule
-            
+
         Returns:
-            JSON string matching ScheduleSchema
+            Dictionary matching ScheduleSchema
         """
         try:
             if target_date is None:
@@ -51,6 +96,9 @@ class SchedulePlanner:
             # Sort tasks by priority and due date
             sorted_tasks = self._sort_tasks_by_priority(tasks)
             
+            # Lowercase and tokenize insights once instead of per task/slot
+            prepped_insights = self._prep_insights(knowledge_insights)
+            
             # Get available time slots
             available_slots = self._get_available_time_slots(
                 target_date_obj, preferences, blocked_times, timezone
@@ -61,16 +109,17 @@ class SchedulePlanner:
             unscheduled_tasks = []
             
             for task in sorted_tasks:
-                blocks, success = self._schedule_task(
-                    task, available_slots, preferences, knowledge_insights, timezone
+                blocks, spans, success = self._schedule_task(
+                    task, available_slots, preferences, prepped_insights, timezone
                 )
                 
                 if success:
                     scheduled_blocks.extend(blocks)
-                    # Remove used time slots
-                    for block in blocks:
-                        available_slots = self._remove_time_slot(
-                            available_slots, block['start'], block['end']
+                    # Remove used time slots (spans carry the minute pairs, so
+                    # no re-parsing of the emitted ISO strings)
+                    for span_start, span_end in spans:
+                        available_slots = self._subtract_time_from_slots(
+                            available_slots, span_start, span_end
                         )
                 else:
                     reason = self._get_unscheduled_reason(task, available_slots, preferences)
@@ -87,40 +136,105 @@ class SchedulePlanner:
                 unscheduled=unscheduled_tasks
             )
             
-            return schedule.json(indent=2)
-            
+            return schedule.dict()
+
         except Exception as e:
             # Fallback schedule
             fallback_date = target_date if target_date else datetime.now().date().isoformat()
-            fallback = {
+            return {
                 "date": fallback_date,
                 "time_zone": timezone,
                 "blocks": [],
                 "unscheduled": [{"task_title": "Schedule creation failed", "reason": str(e)}]
             }
-            return json.dumps(fallback, indent=2)
+
+    def create_schedule(
+        self,
+        tasks: List[Dict[str, Any]],
+        preferences: Dict[str, Any],
+        blocked_times: List[Dict[str, Any]],
+        knowledge_insights: Optional[List[Dict[str, Any]]] = None,
+        target_date: Optional[str] = None,
+        timezone: str = "UTC"
+    ) -> str:
+        """
+        Main method to create a daily schedule.
+
+        Same arguments as create_schedule_dict; returns the schedule as a
+        JSON string matching ScheduleSchema.
+        """
+        # One .dict() pass plus the C-backed encoder beats pydantic's
+        # pure-Python .json() for block-heavy schedules
+        return safe_json_dumps(
+            self.create_schedule_dict(
+                tasks, preferences, blocked_times,
+                knowledge_insights, target_date, timezone
+            ),
+            indent=2
+        )
     
+    # Priority value (high=0, medium=1, low=2)
+    _PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
     def _sort_tasks_by_priority(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Sort tasks by due date first, then priority."""
-        def sort_key(task):
+        """
+        Sort tasks by due date first, then priority.
+
+        Keys are computed once per task up front, so each due date is parsed
+        exactly once and the sort itself runs on plain tuple compares instead
+        of invoking a Python key function O(N log N) times.
+        """
+        keys = []
+        for task in tasks:
             # Due date priority (tasks with due dates come first)
             due_date = task.get('due_date')
-            if due_date:
-                try:
-                    due_dt = datetime.fromisoformat(due_date.replace('Z', '+00:00'))
-                    due_priority = due_dt.timestamp()
-                except:
-                    due_priority = float('inf')
-            else:
-                due_priority = float('inf')
+            keys.append((
+                _due_timestamp(due_date) if due_date else float('inf'),
+                self._PRIORITY_ORDER.get(task.get('priority', 'medium'), 1)
+            ))
+
+        order = sorted(range(len(tasks)), key=keys.__getitem__)
+        return [tasks[i] for i in order]
+    
+    def _prep_insights(
+        self, 
+        knowledge_insights: Optional[List[Dict[str, Any]]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Preprocess insights for the scheduling loop.
+
+        Each insight's summary and impact are lowercased and tokenized once
+        here; the per-slot checks then run on cached token sets instead of
+        re-lowercasing the same strings for every task and candidate slot.
+        """
+        if not knowledge_insights:
+            return None
+        
+        prepped = []
+        for insight in knowledge_insights:
+            summary = insight.get('summary') or ''
+            impact = insight.get('suggested_schedule_impact') or ''
+            impact_lc = impact.lower()
             
-            # Priority value (high=0, medium=1, low=2)
-            priority_map = {"high": 0, "medium": 1, "low": 2}
-            priority_value = priority_map.get(task.get('priority', 'medium'), 1)
+            # Minutes-of-day this insight says to avoid, extracted up front so
+            # the per-slot check is a set lookup instead of strftime + search
+            if 'avoid' in impact_lc:
+                avoid_minutes = frozenset(
+                    int(text[:2]) * 60 + int(text[3:])
+                    for text in _TIME_RE.findall(impact)
+                )
+            else:
+                avoid_minutes = frozenset()
             
-            return (due_priority, priority_value)
+            prepped.append({
+                'summary': summary,
+                'impact': impact,
+                'summary_tokens': frozenset(_WORD_RE.findall(summary.lower())),
+                'impact_tokens': frozenset(_WORD_RE.findall(impact_lc)),
+                'avoid_minutes': avoid_minutes,
+            })
         
-        return sorted(tasks, key=sort_key)
+        return prepped
     
     def _get_available_time_slots(
         self, 
@@ -128,121 +242,152 @@ class SchedulePlanner:
         preferences: Dict[str, Any], 
         blocked_times: List[Dict[str, Any]], 
         timezone: str
-    ) -> List[Tuple[datetime, datetime]]:
-        """Generate list of available time slots for the day."""
+    ) -> List[Tuple[int, int]]:
+        """
+        Generate list of available time slots for the day, in epoch minutes.
+
+        Blocked times are folded in with a single sweep over their sorted
+        start/end events rather than one subtraction pass per interval, so
+        construction is O(B log B) and naturally handles overlapping blocks.
+        """
         # Get work hours from preferences
         work_hours = preferences.get('work_hours', {"start": "09:00", "end": "17:00"})
-        start_time = datetime.combine(
-            date, 
-            time.fromisoformat(work_hours['start'])
-        )
-        end_time = datetime.combine(
-            date, 
-            time.fromisoformat(work_hours['end'])
-        )
-        
-        # Start with the full work day as one slot
-        available_slots = [(start_time, end_time)]
-        
-        # Remove blocked times
+        work_start, work_end = _work_hour_times(work_hours['start'], work_hours['end'])
+        start_time = _to_minutes(datetime.combine(date, work_start))
+        end_time = _to_minutes(datetime.combine(date, work_end))
+
+        if not blocked_times:
+            # The full work day is one slot
+            return [(start_time, end_time)]
+
+        # Sweep line: +1 at each block start, -1 at each block end; free gaps
+        # are the stretches where the blocked depth is zero
+        events = []
         for blocked in blocked_times:
-            blocked_start = datetime.fromisoformat(blocked['start'])
-            blocked_end = datetime.fromisoformat(blocked['end'])
-            
-            # Remove this blocked time from available slots
-            available_slots = self._subtract_time_from_slots(
-                available_slots, blocked_start, blocked_end
-            )
-        
+            events.append((_to_minutes(datetime.fromisoformat(blocked['start'])), 1))
+            events.append((_to_minutes(datetime.fromisoformat(blocked['end'])), -1))
+        events.sort()
+
+        available_slots = []
+        blocked_depth = 0
+        free_from = start_time
+
+        for event_time, delta in events:
+            if delta == 1:
+                if blocked_depth == 0:
+                    gap_start = max(free_from, start_time)
+                    gap_end = min(event_time, end_time)
+                    if gap_start < gap_end:
+                        available_slots.append((gap_start, gap_end))
+                blocked_depth += 1
+            else:
+                blocked_depth -= 1
+                if blocked_depth == 0:
+                    free_from = event_time
+
+        # Tail gap after the last blocked interval
+        gap_start = max(free_from, start_time)
+        if gap_start < end_time:
+            available_slots.append((gap_start, end_time))
+
         return available_slots
     
     def _subtract_time_from_slots(
         self, 
-        slots: List[Tuple[datetime, datetime]], 
-        block_start: datetime, 
-        block_end: datetime
-    ) -> List[Tuple[datetime, datetime]]:
-        """Remove a blocked time period from available slots."""
-        new_slots = []
-        
-        for slot_start, slot_end in slots:
-            if block_end <= slot_start or block_start >= slot_end:
-                # No overlap
-                new_slots.append((slot_start, slot_end))
-            elif block_start <= slot_start and block_end >= slot_end:
-                # Blocked time completely covers this slot - remove it
-                continue
-            elif block_start > slot_start and block_end < slot_end:
-                # Blocked time is in the middle - split into two slots
-                new_slots.append((slot_start, block_start))
-                new_slots.append((block_end, slot_end))
-            elif block_start <= slot_start and block_end < slot_end:
-                # Blocked time covers start of slot
-                new_slots.append((block_end, slot_end))
-            elif block_start > slot_start and block_end >= slot_end:
-                # Blocked time covers end of slot
-                new_slots.append((slot_start, block_start))
-        
-        return new_slots
+        slots: List[Tuple[int, int]], 
+        block_start: int, 
+        block_end: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Remove a blocked time period (in epoch minutes) from available slots.
+
+        Slots are disjoint and sorted by start (the day begins as one interval
+        and subtraction preserves both properties), so the overlapping run is
+        located with bisect and spliced in place - O(log n + k) instead of
+        rebuilding the whole list per blocked interval.
+        """
+        # First slot starting at or after the block end is untouched
+        hi = bisect_left(slots, (block_end,))
+        # First slot starting inside the block, widened to include a
+        # predecessor that runs past the block start
+        lo = bisect_left(slots, (block_start,))
+        if lo > 0 and slots[lo - 1][1] > block_start:
+            lo -= 1
+
+        if lo >= hi:
+            # No overlap
+            return slots
+
+        # Keep the trimmed edges of the outermost overlapping slots
+        replacement = []
+        if slots[lo][0] < block_start:
+            replacement.append((slots[lo][0], block_start))
+        if slots[hi - 1][1] > block_end:
+            replacement.append((block_end, slots[hi - 1][1]))
+
+        slots[lo:hi] = replacement
+        return slots
     
     def _schedule_task(
         self, 
         task: Dict[str, Any], 
-        available_slots: List[Tuple[datetime, datetime]], 
+        available_slots: List[Tuple[int, int]], 
         preferences: Dict[str, Any], 
-        knowledge_insights: Optional[List[Dict[str, Any]]], 
+        prepped_insights: Optional[List[Dict[str, Any]]], 
         timezone: str
-    ) -> Tuple[List[Dict[str, Any]], bool]:
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[int, int]], bool]:
         """
         Schedule a single task into available time slots.
         
+        All arithmetic stays in epoch minutes; datetimes are materialized
+        once per emitted block for the ISO strings and insight notes.
+        
         Returns:
-            Tuple of (scheduled_blocks, success_flag)
+            Tuple of (scheduled_blocks, used_spans, success_flag)
         """
-        duration = task.get('duration_minutes', preferences.get('preferred_focus_minutes', 90))
+        # Bind the per-task fields once; the subtask loop only reads locals
         focus_minutes = preferences.get('preferred_focus_minutes', 90)
-        
+        duration = task.get('duration_minutes', focus_minutes)
+        task_title = task.get('title', 'Untitled Task')
+
         # Split task into subtasks if needed
         subtasks = self._split_task_into_subtasks(task, duration, focus_minutes)
-        
+
+        task_tags = frozenset(task.get('tags', ()))
         scheduled_blocks = []
+        used_spans = []
         
         for i, subtask_duration in enumerate(subtasks):
             # Find a suitable time slot
             slot = self._find_suitable_slot(
-                subtask_duration, available_slots, task, knowledge_insights
+                subtask_duration, available_slots, task_tags, prepped_insights
             )
             
             if slot is None:
                 # Cannot schedule this subtask
-                return scheduled_blocks, False
-            
-            slot_start, slot_end = slot
+                return scheduled_blocks, used_spans, False
             
             # Create the schedule block
-            block_start = slot_start
-            block_end = slot_start + timedelta(minutes=subtask_duration)
+            block_start = slot[0]
+            block_end = block_start + subtask_duration
+            block_start_dt = _from_minutes(block_start)
             
             # Add knowledge-based notes
-            notes = self._generate_block_notes(task, knowledge_insights, block_start)
+            notes = self._generate_block_notes(task_tags, prepped_insights, block_start)
             
             block = {
-                "start": block_start.isoformat(),
-                "end": block_end.isoformat(),
-                "task_title": task.get('title', 'Untitled Task'),
-                "task_id": self._generate_task_id(task, block_start.date()),
+                "start": block_start_dt.isoformat(),
+                "end": _from_minutes(block_end).isoformat(),
+                "task_title": task_title,
+                "task_id": self._generate_task_id(task, block_start_dt.date()),
                 "subtask_index": i + 1,
                 "notes": notes
             }
             
             scheduled_blocks.append(block)
-            
-            # Add break time if this isn't the last subtask
-            if i < len(subtasks) - 1:
-                break_duration = min(15, (slot_end - block_end).total_seconds() // 60)
-                block_end += timedelta(minutes=break_duration)
+            used_spans.append((block_start, block_end))
         
-        return scheduled_blocks, True
+        return scheduled_blocks, used_spans, True
     
     def _split_task_into_subtasks(
         self, 
@@ -267,92 +412,82 @@ class SchedulePlanner:
     def _find_suitable_slot(
         self, 
         duration_minutes: int, 
-        available_slots: List[Tuple[datetime, datetime]], 
-        task: Dict[str, Any], 
-        knowledge_insights: Optional[List[Dict[str, Any]]]
-    ) -> Optional[Tuple[datetime, datetime]]:
-        """Find the first available slot that can fit the duration."""
-        required_duration = timedelta(minutes=duration_minutes)
-        
-        for slot_start, slot_end in available_slots:
-            slot_duration = slot_end - slot_start
-            
-            if slot_duration >= required_duration:
+        available_slots: List[Tuple[int, int]], 
+        task_tags: frozenset, 
+        prepped_insights: Optional[List[Dict[str, Any]]]
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Find the best-fit available slot for the duration.
+
+        Among suitable slots the one wasting the fewest minutes wins (ties go
+        to the earliest), which keeps large slots intact for large tasks and
+        lowers the unscheduled rate on fragmented days. An exact fit ends the
+        scan early.
+        """
+        best_slot = None
+        best_waste = -1
+
+        for slot in available_slots:
+            waste = slot[1] - slot[0] - duration_minutes
+            if waste >= 0 and (best_slot is None or waste < best_waste):
                 # Check if knowledge insights suggest avoiding this time
-                if self._is_time_suitable(slot_start, task, knowledge_insights):
-                    return (slot_start, slot_end)
-        
-        return None
+                if self._is_time_suitable(slot[0], task_tags, prepped_insights):
+                    if waste == 0:
+                        return slot
+                    best_slot = slot
+                    best_waste = waste
+
+        return best_slot
     
     def _is_time_suitable(
         self, 
-        start_time: datetime, 
-        task: Dict[str, Any], 
-        knowledge_insights: Optional[List[Dict[str, Any]]]
+        start_minute: int, 
+        task_tags: frozenset, 
+        prepped_insights: Optional[List[Dict[str, Any]]]
     ) -> bool:
-        """Check if a time slot is suitable based on knowledge insights."""
-        if not knowledge_insights:
+        """Check if a time slot is suitable based on preprocessed insights."""
+        if not prepped_insights:
             return True
         
-        task_tags = task.get('tags', [])
+        minute_of_day = start_minute % 1440
         
-        for insight in knowledge_insights:
-            impact = insight.get('suggested_schedule_impact', '')
-            if impact and any(tag in impact.lower() for tag in task_tags):
+        for insight in prepped_insights:
+            if minute_of_day in insight['avoid_minutes']:
                 # This insight affects this task type
-                if 'avoid' in impact.lower() and start_time.strftime('%H:%M') in impact:
+                if not insight['impact_tokens'].isdisjoint(task_tags):
                     return False
         
         return True
     
     def _generate_block_notes(
         self, 
-        task: Dict[str, Any], 
-        knowledge_insights: Optional[List[Dict[str, Any]]], 
-        start_time: datetime
+        task_tags: frozenset, 
+        prepped_insights: Optional[List[Dict[str, Any]]], 
+        start_minute: int
     ) -> Optional[str]:
-        """Generate notes for a schedule block based on knowledge insights."""
-        if not knowledge_insights:
+        """Generate notes for a schedule block from preprocessed insights."""
+        if not prepped_insights:
             return None
         
         notes = []
-        task_tags = task.get('tags', [])
+        hour_text = '%02d' % ((start_minute // 60) % 24)
         
-        for insight in knowledge_insights:
-            summary = insight.get('summary', '')
-            impact = insight.get('suggested_schedule_impact', '')
-            
-            if summary and any(tag in summary.lower() for tag in task_tags):
-                notes.append(f"{summary}")
-            elif impact and start_time.strftime('%H') in impact:
-                notes.append(f"{impact}")
+        for insight in prepped_insights:
+            if insight['summary'] and not insight['summary_tokens'].isdisjoint(task_tags):
+                notes.append(insight['summary'])
+            elif insight['impact'] and hour_text in insight['impact']:
+                notes.append(insight['impact'])
         
         return '; '.join(notes) if notes else None
     
     def _generate_task_id(self, task: Dict[str, Any], date: date) -> str:
         """Generate a deterministic task ID."""
-        title = task.get('title', 'task')
-        # Create a slug from the title
-        slug = title.lower().replace(' ', '-').replace('_', '-')
-        slug = ''.join(c for c in slug if c.isalnum() or c == '-')[:20]
-        return f"{slug}-{date.strftime('%Y%m%d')}"
-    
-    def _remove_time_slot(
-        self, 
-        slots: List[Tuple[datetime, datetime]], 
-        used_start: str, 
-        used_end: str
-    ) -> List[Tuple[datetime, datetime]]:
-        """Remove a used time slot from available slots."""
-        used_start_dt = datetime.fromisoformat(used_start)
-        used_end_dt = datetime.fromisoformat(used_end)
-        
-        return self._subtract_time_from_slots(slots, used_start_dt, used_end_dt)
+        return f"{slugify(task.get('title', 'task'))}-{date.strftime('%Y%m%d')}"
     
     def _get_unscheduled_reason(
         self, 
         task: Dict[str, Any], 
-        available_slots: List[Tuple[datetime, datetime]], 
+        available_slots: List[Tuple[int, int]], 
         preferences: Dict[str, Any]
     ) -> str:
         """Generate a reason why a task couldn't be scheduled."""
@@ -361,12 +496,9 @@ class SchedulePlanner:
         if not available_slots:
             return "No available time slots remaining"
         
-        max_slot_duration = max(
-            (slot[1] - slot[0]).total_seconds() // 60 
-            for slot in available_slots
-        )
+        max_slot_duration = max(slot[1] - slot[0] for slot in available_slots)
         
         if duration > max_slot_duration:
-            return f"Task requires {duration} minutes, but largest available slot is {int(max_slot_duration)} minutes"
+            return f"Task requires {duration} minutes, but largest available slot is {max_slot_duration} minutes"
         
         return "Could not find suitable time slot"
\ No newline at end of file
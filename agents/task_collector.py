@@ -3,12 +3,57 @@ TaskCollector Agent - Converts natural language to structured task JSON.
 This agent strictly follows the TaskSchema and returns only valid JSON.
 """
 
-import json
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Any, Union, Optional
 from dateutil.parser import parse as parse_date
 from schemas.task_schema import Task, TaskList
+from utils.json_utils import safe_json_dumps
+
+# Patterns compiled once at import time; per-call re.search(str, ...) pays a
+# cache lookup and compile check on every invocation
+_NUMBERED_INLINE_RE = re.compile(r'\d+\.\s+[^\n]+\s+\d+\.')
+_NUMBER_SPLIT_RE = re.compile(r'\s+(?=\d+\.)')
+_NUMBER_PREFIX_RE = re.compile(r'^\d+\.\s*')
+_SEPARATOR_RES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'\n\d+\.',  # Numbered lists with line breaks
+        r'\n-\s*',   # Dash lists
+        r'\n\*\s*',  # Bullet lists
+        r'\band\s+',  # "and" separator
+        r',\s*then\s*',  # "then" separator
+        r';\s*'      # Semicolon separator
+    )
+]
+_TITLE_PREFIX_RE = re.compile(r'^(task:?\s*|todo:?\s*)', re.IGNORECASE)
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?;]|\s+by\s+|\s+due\s+|\s+for\s+\d+')
+_LEADING_SEPARATOR_RE = re.compile(r'^[.,:;-]+\s*')
+_EMPHASIS_RE = re.compile(r'!!+|URGENT|ASAP')
+_HEDGING_RE = re.compile(r'maybe|might|could|optional')
+
+# Recurring-phrase dispatch: one scan plus a phrase-to-value map replaces
+# three any()/in cascades; daily wins over weekly over monthly when a text
+# mentions several, matching the old cascade order
+_RECURRING_MAP = {
+    'daily': 'daily', 'every day': 'daily', 'each day': 'daily',
+    'weekly': 'weekly', 'every week': 'weekly', 'each week': 'weekly',
+    'monthly': 'monthly', 'every month': 'monthly', 'each month': 'monthly',
+}
+_RECURRING_SCAN_RE = re.compile(
+    '|'.join(sorted(map(re.escape, _RECURRING_MAP), key=len, reverse=True))
+)
+_RECURRING_ORDER = ('daily', 'weekly', 'monthly')
+
+# Relative-date dispatch tables used by _extract_due_date
+_RELATIVE_DAY_OFFSETS = {'today': 0, 'tomorrow': 1, 'next week': 7, 'next month': 30}
+_WEEKDAY_IDX = {
+    name: index
+    for index, name in enumerate(
+        ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+    )
+}
 
 class TaskCollector:
     """
@@ -32,14 +77,69 @@ class TaskCollector:
         
         # Medium is default for everything else
     }
-    
-    DURATION_PATTERNS = {
-        r'(\d+)\s*hour?s?': lambda x: int(x) * 60,
-        r'(\d+)\s*min(?:ute)?s?': lambda x: int(x),
-        r'(\d+)h\s*(\d+)m': lambda h, m: int(h) * 60 + int(m),
-        r'(\d+)h': lambda x: int(x) * 60,
-        r'(\d+)m': lambda x: int(x),
+
+    # One alternation over the priority keywords (longest first) so a task
+    # text is scanned once instead of once per keyword
+    _PRIORITY_SCAN_RE = re.compile(
+        '|'.join(
+            re.escape(keyword)
+            for keyword in sorted(PRIORITY_MAPPING, key=len, reverse=True)
+        )
+    )
+
+    TAG_KEYWORDS = {
+        'work': ['work', 'office', 'meeting', 'project', 'deadline', 'client'],
+        'personal': ['personal', 'home', 'family', 'hobby'],
+        'health': ['exercise', 'gym', 'doctor', 'medication', 'health'],
+        'shopping': ['buy', 'purchase', 'shop', 'grocery', 'store'],
+        'communication': ['call', 'email', 'text', 'message', 'contact'],
+        'travel': ['travel', 'trip', 'flight', 'hotel', 'vacation'],
+        'finance': ['pay', 'bill', 'bank', 'money', 'budget'],
+        'learning': ['learn', 'study', 'course', 'book', 'research'],
+        'maintenance': ['fix', 'repair', 'clean', 'maintain', 'organize']
+    }
+
+    # Single-pass scan machinery: one alternation (longest keyword first, so
+    # e.g. 'repair' wins over the embedded 'pay') plus a keyword-to-tag map,
+    # replacing ~40 independent substring searches per task
+    _KEYWORD_TO_TAG = {
+        keyword: tag
+        for tag, keywords in TAG_KEYWORDS.items()
+        for keyword in keywords
     }
+    _TAG_SCAN_RE = re.compile(
+        '|'.join(
+            re.escape(keyword)
+            for keyword in sorted(_KEYWORD_TO_TAG, key=len, reverse=True)
+        )
+    )
+
+    # All duration forms as one alternation, most specific first so
+    # "1h 30m" is never half-consumed by the bare "1h" branch. Matched
+    # against pre-lowercased text, so no IGNORECASE case folding per scan.
+    _DURATION_RE = re.compile(
+        r'(?P<hm_h>\d+)h\s*(?P<hm_m>\d+)m'
+        r'|(?P<hours>\d+)\s*hour?s?'
+        r'|(?P<minutes>\d+)\s*min(?:ute)?s?'
+        r'|(?P<h>\d+)h'
+        r'|(?P<m>\d+)m'
+    )
+
+    # Matched against pre-lowercased text as well
+    _DATE_RES = [
+        re.compile(pattern)
+        for pattern in (
+            r'by\s+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+            r'due\s+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+            r'on\s+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+            r'by\s+(today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
+            r'due\s+(today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
+            r'(today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
+            r'by\s+(next\s+week|next\s+month)',
+            r'in\s+(\d+)\s+days?',
+            r'(\d{4}-\d{2}-\d{2})',  # ISO format
+        )
+    ]
     
     def __init__(self):
         """Initialize TaskCollector with system prompt behavior."""
@@ -66,31 +166,22 @@ class TaskCollector:
     def _split_multiple_tasks(self, text: str) -> List[str]:
         """Split input into individual tasks if multiple are present."""
         # Check for numbered lists without line breaks (e.g., "1. Task 2. Task 3. Task")
-        if re.search(r'\d+\.\s+[^\n]+\s+\d+\.', text):
+        if _NUMBERED_INLINE_RE.search(text):
             # Split by number patterns
-            parts = re.split(r'\s+(?=\d+\.)', text)
+            parts = _NUMBER_SPLIT_RE.split(text)
             tasks = []
             for part in parts:
                 # Remove the number prefix
-                task = re.sub(r'^\d+\.\s*', '', part).strip()
+                task = _NUMBER_PREFIX_RE.sub('', part).strip()
                 if task:
                     tasks.append(task)
             return tasks if len(tasks) > 1 else [text.strip()]
         
         # Common separators for multiple tasks
-        separators = [
-            r'\n\d+\.',  # Numbered lists with line breaks
-            r'\n-\s*',   # Dash lists
-            r'\n\*\s*',  # Bullet lists
-            r'\band\s+',  # "and" separator
-            r',\s*then\s*',  # "then" separator
-            r';\s*'      # Semicolon separator
-        ]
-        
-        for pattern in separators:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in _SEPARATOR_RES:
+            if pattern.search(text):
                 # Split by pattern and clean up
-                parts = re.split(pattern, text)
+                parts = pattern.split(text)
                 return [part.strip() for part in parts if part.strip()]
         
         # No multiple tasks detected
@@ -98,14 +189,17 @@ class TaskCollector:
     
     def _process_single_task(self, task_text: str) -> Dict[str, Any]:
         """Process a single task description into TaskSchema format."""
+        # Lowercase once; the case-insensitive extractors share this copy
+        # (title/description/priority still need the original casing)
+        text_lower = task_text.lower()
         result = {
             "title": self._extract_title(task_text),
             "description": self._extract_description(task_text),
             "priority": self._extract_priority(task_text),
-            "due_date": self._extract_due_date(task_text),
-            "duration_minutes": self._extract_duration(task_text),
-            "tags": self._extract_tags(task_text),
-            "recurring": self._extract_recurring(task_text)
+            "due_date": self._extract_due_date(text_lower),
+            "duration_minutes": self._extract_duration(text_lower),
+            "tags": list(self._scan_tags(text_lower)),
+            "recurring": self._extract_recurring(text_lower)
         }
         
         # Remove None values for cleaner JSON
@@ -118,10 +212,10 @@ class TaskCollector:
             return text.strip()
         
         # Only remove prefixes for longer texts to extract core task
-        cleaned_text = re.sub(r'^(task:?\s*|todo:?\s*)', '', text, flags=re.IGNORECASE)
+        cleaned_text = _TITLE_PREFIX_RE.sub('', text)
         
         # Extract first sentence/clause
-        sentences = re.split(r'[.!?;]|\s+by\s+|\s+due\s+|\s+for\s+\d+', cleaned_text)
+        sentences = _SENTENCE_SPLIT_RE.split(cleaned_text)
         return sentences[0].strip() if sentences else cleaned_text.strip()
     
     def _extract_description(self, text: str) -> Optional[str]:
@@ -132,62 +226,50 @@ class TaskCollector:
         if len(text) > len(title) + 20:
             description = text.replace(title, '', 1).strip()
             # Clean up common separators
-            description = re.sub(r'^[.,:;-]+\s*', '', description)
+            description = _LEADING_SEPARATOR_RE.sub('', description)
             return description if description else None
         
         return None
     
-    def _extract_priority(self, text: str) -> Optional[str]:
-        """Extract priority based on keywords."""
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _extract_priority(text: str) -> Optional[str]:
+        """Extract priority based on keywords, memoized per task text."""
         text_lower = text.lower()
-        
-        for keyword, priority in self.PRIORITY_MAPPING.items():
-            if keyword in text_lower:
-                return priority
-        
+
+        matched = set(TaskCollector._PRIORITY_SCAN_RE.findall(text_lower))
+        if matched:
+            # Resolve ties in mapping order, matching the old first-hit rule
+            for keyword, priority in TaskCollector.PRIORITY_MAPPING.items():
+                if keyword in matched:
+                    return priority
+
         # Check for emphasis patterns
-        if re.search(r'!!+|URGENT|ASAP', text):
+        if _EMPHASIS_RE.search(text):
             return "high"
-        elif re.search(r'maybe|might|could|optional', text_lower):
+        elif _HEDGING_RE.search(text_lower):
             return "low"
         
         return "medium"  # Default
     
-    def _extract_due_date(self, text: str) -> Optional[str]:
-        """Extract due date from natural language."""
-        # Common date patterns
-        date_patterns = [
-            r'by\s+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'due\s+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'on\s+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'by\s+(today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-            r'due\s+(today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-            r'(today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-            r'by\s+(next\s+week|next\s+month)',
-            r'in\s+(\d+)\s+days?',
-            r'(\d{4}-\d{2}-\d{2})',  # ISO format
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+    def _extract_due_date(self, text_lower: str) -> Optional[str]:
+        """Extract due date from natural language (pre-lowercased text)."""
+        for pattern in self._DATE_RES:
+            match = pattern.search(text_lower)
             if match:
-                date_str = match.group(1)
+                # Normalize whitespace so "next  week" hits the table too
+                date_key = ' '.join(match.group(1).split())
                 try:
-                    # Parse relative dates
-                    if date_str.lower() == 'today':
-                        return datetime.now().isoformat()
-                    elif date_str.lower() == 'tomorrow':
-                        return (datetime.now() + timedelta(days=1)).isoformat()
-                    elif 'next week' in date_str.lower():
-                        return (datetime.now() + timedelta(weeks=1)).isoformat()
-                    elif 'next month' in date_str.lower():
-                        return (datetime.now() + timedelta(days=30)).isoformat()
-                    elif date_str.lower() in ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']:
+                    # Parse relative dates via the dispatch tables
+                    offset = _RELATIVE_DAY_OFFSETS.get(date_key)
+                    if offset is not None:
+                        return (datetime.now() + timedelta(days=offset)).isoformat()
+                    elif date_key in _WEEKDAY_IDX:
                         # Find next occurrence of this weekday
-                        return self._next_weekday(date_str).isoformat()
+                        return self._next_weekday(date_key).isoformat()
                     else:
                         # Try to parse the date string
-                        parsed_date = parse_date(date_str, fuzzy=True)
+                        parsed_date = parse_date(match.group(1), fuzzy=True)
                         return parsed_date.isoformat()
                 except:
                     continue
@@ -196,71 +278,70 @@ class TaskCollector:
     
     def _next_weekday(self, weekday_name: str) -> datetime:
         """Find the next occurrence of a given weekday."""
-        weekdays = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6
-        }
-        
-        target_day = weekdays[weekday_name.lower()]
-        current_day = datetime.now().weekday()
-        
-        days_ahead = target_day - current_day
+        return self._next_weekday_from(weekday_name.lower(), datetime.now().date())
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _next_weekday_from(weekday_name: str, today) -> datetime:
+        """
+        Resolve a weekday name against a reference date, cached per day.
+
+        Keying on today keeps at most seven entries live and invalidates the
+        cache at the day boundary.
+        """
+        days_ahead = _WEEKDAY_IDX[weekday_name] - today.weekday()
         if days_ahead <= 0:  # Target day already happened this week
             days_ahead += 7
         
-        return datetime.now() + timedelta(days=days_ahead)
+        return datetime.combine(today + timedelta(days=days_ahead), datetime.now().time())
     
-    def _extract_duration(self, text: str) -> Optional[int]:
-        """Extract duration in minutes from text."""
-        for pattern, converter in self.DURATION_PATTERNS.items():
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    if len(match.groups()) == 2:  # e.g., "2h 30m"
-                        return converter(*match.groups())
-                    else:
-                        return converter(match.group(1))
-                except:
-                    continue
-        
-        return None
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _extract_duration(text_lower: str) -> Optional[int]:
+        """Extract duration in minutes from pre-lowercased text, memoized."""
+        match = TaskCollector._DURATION_RE.search(text_lower)
+        if not match:
+            return None
+
+        if match.group('hm_h'):  # e.g., "2h 30m"
+            return int(match.group('hm_h')) * 60 + int(match.group('hm_m'))
+        if match.group('hours') or match.group('h'):
+            return int(match.group('hours') or match.group('h')) * 60
+        return int(match.group('minutes') or match.group('m'))
     
     def _extract_tags(self, text: str) -> List[str]:
         """Extract 1-4 relevant tags from the task text."""
-        # Common tag patterns
-        tag_keywords = {
-            'work': ['work', 'office', 'meeting', 'project', 'deadline', 'client'],
-            'personal': ['personal', 'home', 'family', 'hobby'],
-            'health': ['exercise', 'gym', 'doctor', 'medication', 'health'],
-            'shopping': ['buy', 'purchase', 'shop', 'grocery', 'store'],
-            'communication': ['call', 'email', 'text', 'message', 'contact'],
-            'travel': ['travel', 'trip', 'flight', 'hotel', 'vacation'],
-            'finance': ['pay', 'bill', 'bank', 'money', 'budget'],
-            'learning': ['learn', 'study', 'course', 'book', 'research'],
-            'maintenance': ['fix', 'repair', 'clean', 'maintain', 'organize']
-        }
-        
-        text_lower = text.lower()
-        tags = []
-        
-        for tag, keywords in tag_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
-                tags.append(tag)
-        
-        # Limit to 4 tags maximum
-        return tags[:4]
+        # Fresh list per call so callers can't mutate the cached tuple
+        return list(self._scan_tags(text.lower()))
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _scan_tags(text_lower: str) -> tuple:
+        """One scan over the text finds every keyword occurrence."""
+        keyword_to_tag = TaskCollector._KEYWORD_TO_TAG
+        all_tags = TaskCollector.TAG_KEYWORDS
+        found = set()
+
+        for match in TaskCollector._TAG_SCAN_RE.finditer(text_lower):
+            found.add(keyword_to_tag[match.group()])
+            if len(found) == len(all_tags):
+                # Every category already matched; no point scanning on
+                break
+
+        # Emit in category order, limited to 4 tags maximum
+        return tuple(tag for tag in all_tags if tag in found)[:4]
     
-    def _extract_recurring(self, text: str) -> Optional[str]:
-        """Extract recurring pattern from text."""
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ['daily', 'every day', 'each day']):
-            return 'daily'
-        elif any(word in text_lower for word in ['weekly', 'every week', 'each week']):
-            return 'weekly'
-        elif any(word in text_lower for word in ['monthly', 'every month', 'each month']):
-            return 'monthly'
-        
+    def _extract_recurring(self, text_lower: str) -> Optional[str]:
+        """Extract recurring pattern from pre-lowercased text."""
+        matched = {
+            _RECURRING_MAP[phrase]
+            for phrase in _RECURRING_SCAN_RE.findall(text_lower)
+        }
+        if matched:
+            for value in _RECURRING_ORDER:
+                if value in matched:
+                    return value
+
         return None
     
     def validate_task_json(self, task_dict: Dict) -> bool:
@@ -271,17 +352,16 @@ class TaskCollector:
         except Exception:
             return False
     
-    def process_user_input(self, user_input: str) -> str:
+    def process_user_input_dict(self, user_input: str) -> Union[List[Dict], Dict]:
         """
-        Main entry point that returns JSON string following the system prompt.
-        Returns ONLY JSON as specified in the system prompt.
+        Extract tasks as Python objects for in-process callers.
+        Same contract as process_user_input without the JSON round trip.
         """
         try:
-            result = self.extract_tasks(user_input)
-            return json.dumps(result, indent=2)
-        except Exception as e:
+            return self.extract_tasks(user_input)
+        except Exception:
             # Fallback - return basic task structure
-            fallback = {
+            return {
                 "title": user_input[:100],
                 "description": None,
                 "priority": "medium",
@@ -290,4 +370,10 @@ class TaskCollector:
                 "tags": [],
                 "recurring": None
             }
-            return json.dumps(fallback, indent=2)
\ No newline at end of file
+
+    def process_user_input(self, user_input: str) -> str:
+        """
+        Main entry point that returns JSON string following the system prompt.
+        Returns ONLY JSON as specified in the system prompt.
+        """
+        return safe_json_dumps(self.process_user_input_dict(user_input), indent=2)
\ No newline at end of file
@@ -10,8 +10,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from orchestrator import OrchestratorAgent
 from tools.tool_registry import get_tool_registry
 from tools.base_tool import ToolInput
-from config.settings import get_config
-import json
+from config.settings import FROZEN_CONFIG
+from utils.helpers import buffered_output
+from operator import itemgetter
+import asyncio
+import io
+from utils.json_utils import safe_json_loads
 
 def demo_adk_integration():
     """Demonstrate Agent Development Kit integration."""
@@ -19,7 +23,7 @@ def demo_adk_integration():
     print("=" * 50)
     
     # Initialize orchestrator with ADK tools
-    config = get_config()
+    config = FROZEN_CONFIG
     orchestrator = OrchestratorAgent(config['api_keys'])
     
     print("🔧 ADK Tools Available:")
@@ -33,10 +37,10 @@ def demo_adk_integration():
     
     return orchestrator, tool_registry
 
-def demo_weather_tool(tool_registry):
+def demo_weather_tool(tool_registry, out=sys.stdout):
     """Demonstrate weather tool capabilities."""
-    print("🌤️ Weather Tool Demo")
-    print("-" * 30)
+    print("🌤️ Weather Tool Demo", file=out)
+    print("-" * 30, file=out)
     
     weather_tool = tool_registry.get_tool('weather_service')
     if weather_tool:
@@ -47,23 +51,23 @@ def demo_weather_tool(tool_registry):
         )
         
         result = weather_tool.execute(input_data)
-        print(f"Weather Query Result:")
-        print(f"Success: {result.success}")
+        print(f"Weather Query Result:", file=out)
+        print(f"Success: {result.success}", file=out)
         if result.success:
             weather_data = result.result.get('weather', {})
             recommendations = result.result.get('scheduling_recommendations', [])
-            print(f"Location: {weather_data.get('location', 'N/A')}")
-            print(f"Temperature: {weather_data.get('temperature', 'N/A')}°F")
-            print(f"Condition: {weather_data.get('condition', 'N/A')}")
-            print(f"Scheduling Recommendations:")
+            print(f"Location: {weather_data.get('location', 'N/A')}", file=out)
+            print(f"Temperature: {weather_data.get('temperature', 'N/A')}°F", file=out)
+            print(f"Condition: {weather_data.get('condition', 'N/A')}", file=out)
+            print(f"Scheduling Recommendations:", file=out)
             for rec in recommendations[:2]:
-                print(f"   • {rec}")
-        print()
+                print(f"   • {rec}", file=out)
+        print(file=out)
 
-def demo_search_tool(tool_registry):
+def demo_search_tool(tool_registry, out=sys.stdout):
     """Demonstrate search tool capabilities."""
-    print("🔍 Search Tool Demo")
-    print("-" * 30)
+    print("🔍 Search Tool Demo", file=out)
+    print("-" * 30, file=out)
     
     search_tool = tool_registry.get_tool('google_search')
     if search_tool:
@@ -74,20 +78,23 @@ def demo_search_tool(tool_registry):
         )
         
         result = search_tool.execute(input_data)
-        print(f"Search Query Result:")
-        print(f"Success: {result.success}")
+        print(f"Search Query Result:", file=out)
+        print(f"Success: {result.success}", file=out)
         if result.success and result.result:
-            print("Search Results:")
-            for i, item in enumerate(result.result[:2], 1):
-                print(f"   {i}. {item.get('title', 'N/A')}")
-                print(f"      {item.get('snippet', 'N/A')[:100]}...")
-                print(f"      Source: {item.get('displayLink', 'N/A')}")
-        print()
+            print("Search Results:", file=out)
+            # SearchTool normalizes every item to these keys, so one
+            # C-level itemgetter replaces three dict lookups per result
+            fields = itemgetter('title', 'snippet', 'displayLink')
+            for i, (title, snippet, source) in enumerate(map(fields, result.result[:2]), 1):
+                print(f"   {i}. {title}", file=out)
+                print(f"      {snippet[:100]}...", file=out)
+                print(f"      Source: {source}", file=out)
+        print(file=out)
 
-def demo_calendar_tool(tool_registry):
+def demo_calendar_tool(tool_registry, out=sys.stdout):
     """Demonstrate calendar tool capabilities."""
-    print("📅 Calendar Tool Demo")
-    print("-" * 30)
+    print("📅 Calendar Tool Demo", file=out)
+    print("-" * 30, file=out)
     
     calendar_tool = tool_registry.get_tool('calendar_manager')
     if calendar_tool:
@@ -103,11 +110,11 @@ def demo_calendar_tool(tool_registry):
         )
         
         result = calendar_tool.execute(input_data)
-        print(f"Add Event Result:")
-        print(f"Success: {result.success}")
+        print(f"Add Event Result:", file=out)
+        print(f"Success: {result.success}", file=out)
         if result.success:
-            print(f"Event Created: {result.result.get('title', 'N/A')}")
-            print(f"Event ID: {result.result.get('id', 'N/A')}")
+            print(f"Event Created: {result.result.get('title', 'N/A')}", file=out)
+            print(f"Event ID: {result.result.get('id', 'N/A')}", file=out)
         
         # Check availability
         input_data = ToolInput(
@@ -119,45 +126,45 @@ def demo_calendar_tool(tool_registry):
         )
         
         result = calendar_tool.execute(input_data)
-        print(f"\\nAvailability Check:")
-        print(f"Success: {result.success}")
+        print(f"\\nAvailability Check:", file=out)
+        print(f"Success: {result.success}", file=out)
         if result.success:
             availability_data = result.result
-            print(f"Is Available: {availability_data.get('is_available', 'N/A')}")
-            print(f"Conflicts Found: {len(availability_data.get('conflicts', []))}")
-            print(f"Available Slots: {len(availability_data.get('available_slots', []))}")
-        print()
+            print(f"Is Available: {availability_data.get('is_available', 'N/A')}", file=out)
+            print(f"Conflicts Found: {len(availability_data.get('conflicts', []))}", file=out)
+            print(f"Available Slots: {len(availability_data.get('available_slots', []))}", file=out)
+        print(file=out)
 
-def demo_enhanced_knowledge_agent(orchestrator):
+def demo_enhanced_knowledge_agent(orchestrator, out=sys.stdout):
     """Demonstrate enhanced knowledge agent with ADK tools."""
-    print("🧠 Enhanced Knowledge Agent Demo")
-    print("-" * 30)
+    print("🧠 Enhanced Knowledge Agent Demo", file=out)
+    print("-" * 30, file=out)
     
     # Test weather-aware insights
-    print("Testing weather-aware insights:")
+    print("Testing weather-aware insights:", file=out)
     response = orchestrator.knowledge_agent.fetch_insights_with_tools(
         ["weather forecast for outdoor activities"], 
         location="New York"
     )
-    insights = json.loads(response)
+    insights = safe_json_loads(response)
     for insight in insights:
-        print(f"   • Query: {insight.get('query', 'N/A')}")
-        print(f"   • Summary: {insight.get('summary', 'N/A')}")
-        print(f"   • Source: {insight.get('source', 'N/A')}")
-        print(f"   • Schedule Impact: {insight.get('suggested_schedule_impact', 'None')}")
-    print()
+        print(f"   • Query: {insight.get('query', 'N/A')}", file=out)
+        print(f"   • Summary: {insight.get('summary', 'N/A')}", file=out)
+        print(f"   • Source: {insight.get('source', 'N/A')}", file=out)
+        print(f"   • Schedule Impact: {insight.get('suggested_schedule_impact', 'None')}", file=out)
+    print(file=out)
     
     # Test search-powered insights
-    print("Testing search-powered insights:")
+    print("Testing search-powered insights:", file=out)
     response = orchestrator.knowledge_agent.fetch_insights_with_tools(
         ["research productivity timing for analytical work"]
     )
-    insights = json.loads(response)
+    insights = safe_json_loads(response)
     for insight in insights:
-        print(f"   • Query: {insight.get('query', 'N/A')}")
-        print(f"   • Summary: {insight.get('summary', 'N/A')}")
-        print(f"   • Source: {insight.get('source', 'N/A')}")
-    print()
+        print(f"   • Query: {insight.get('query', 'N/A')}", file=out)
+        print(f"   • Summary: {insight.get('summary', 'N/A')}", file=out)
+        print(f"   • Source: {insight.get('source', 'N/A')}", file=out)
+    print(file=out)
 
 def demo_tool_usage_statistics(tool_registry):
     """Demonstrate tool usage analytics."""
@@ -171,6 +178,31 @@ def demo_tool_usage_statistics(tool_registry):
         print(f"     Last Used: {tool_stats.get('last_used', 'Never')}")
     print()
 
+async def _run_buffered(demo, *args):
+    """Run a sync demo in a worker thread, capturing its output."""
+    buffer = io.StringIO()
+    await asyncio.to_thread(demo, *args, out=buffer)
+    return buffer
+
+async def run_tool_demos(orchestrator, tool_registry):
+    """
+    Run the independent tool demos concurrently.
+
+    Each demo writes to its own buffer, so output is printed in submission
+    order even though the underlying network-bound calls overlap.
+    """
+    buffers = await asyncio.gather(
+        _run_buffered(demo_weather_tool, tool_registry),
+        _run_buffered(demo_search_tool, tool_registry),
+        _run_buffered(demo_calendar_tool, tool_registry),
+        _run_buffered(demo_enhanced_knowledge_agent, orchestrator),
+        return_exceptions=True
+    )
+    for buffer in buffers:
+        if isinstance(buffer, BaseException):
+            raise buffer
+        print(buffer.getvalue(), end='')
+
 def main():
     """Run ADK integration demonstration."""
     print("🚀 Smart Daily Productivity Assistant")
@@ -179,19 +211,17 @@ def main():
     print("This demo shows enhanced capabilities with ADK tools integration.\\n")
     
     try:
-        # Initialize system with ADK
-        orchestrator, tool_registry = demo_adk_integration()
-        
-        # Demonstrate individual tools
-        demo_weather_tool(tool_registry)
-        demo_search_tool(tool_registry)
-        demo_calendar_tool(tool_registry)
+        # Initialize system with ADK; sections flush their prints as one
+        # write each (the concurrent demos already buffer per task)
+        with buffered_output():
+            orchestrator, tool_registry = demo_adk_integration()
         
-        # Demonstrate enhanced agent capabilities
-        demo_enhanced_knowledge_agent(orchestrator)
+        # Run the independent tool and agent demos concurrently
+        asyncio.run(run_tool_demos(orchestrator, tool_registry))
         
         # Show usage analytics
-        demo_tool_usage_statistics(tool_registry)
+        with buffered_output():
+            demo_tool_usage_statistics(tool_registry)
         
         print("✅ ADK Integration Demo Completed Successfully!")
         print("\\n💡 Key ADK Benefits:")
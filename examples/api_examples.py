@@ -7,21 +7,26 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import json
+import asyncio
+import functools
 from typing import Optional
 from orchestrator import OrchestratorAgent
-from config.settings import get_config
+from config.settings import FROZEN_CONFIG
+from utils.json_utils import safe_json_dumps
 
 class ProductivityAPI:
     """Wrapper API for easy integration."""
     
     def __init__(self, api_keys=None):
         """Initialize the API."""
-        config = get_config()
-        if api_keys:
-            config['api_keys'].update(api_keys)
-        
-        self.orchestrator = OrchestratorAgent(config['api_keys'])
+        # Merge onto the frozen defaults instead of mutating shared config
+        merged_keys = {**FROZEN_CONFIG['api_keys'], **(api_keys or {})}
+
+        self.orchestrator = OrchestratorAgent(merged_keys)
+
+        # Lazily started by submit(); coalesces concurrent async requests
+        self._batch_queue = None
+        self._batch_worker = None
     
     def add_task(self, task_description: str) -> dict:
         """
@@ -33,8 +38,7 @@ class ProductivityAPI:
         Returns:
             Dictionary with task data and status
         """
-        response = self.orchestrator.process_user_request(task_description, machine_mode=True)
-        return json.loads(response)
+        return self.orchestrator.process_user_request(task_description, return_format='dict')
     
     def plan_day(self, date: Optional[str] = None) -> dict:
         """
@@ -47,8 +51,7 @@ class ProductivityAPI:
             Dictionary with schedule data
         """
         request = f"Plan my day for {date}" if date else "Plan my day"
-        response = self.orchestrator.process_user_request(request, machine_mode=True)
-        return json.loads(response)
+        return self.orchestrator.process_user_request(request, return_format='dict')
     
     def get_reminders(self) -> dict:
         """
@@ -57,8 +60,7 @@ class ProductivityAPI:
         Returns:
             Dictionary with alerts and overdue tasks
         """
-        response = self.orchestrator.process_user_request("Check reminders", machine_mode=True)
-        return json.loads(response)
+        return self.orchestrator.process_user_request("Check reminders", return_format='dict')
     
     def update_preferences(self, preferences: dict) -> dict:
         """
@@ -72,67 +74,187 @@ class ProductivityAPI:
         """
         # Convert preferences to natural language
         pref_text = self._preferences_to_text(preferences)
-        response = self.orchestrator.process_user_request(pref_text, machine_mode=True)
-        return json.loads(response)
+        return self.orchestrator.process_user_request(pref_text, return_format='dict')
+    
+    def batch(self, requests: list) -> list:
+        """
+        Process several requests in one orchestrator call.
+        
+        Args:
+            requests: Natural language requests, in execution order
+            
+        Returns:
+            List of response dictionaries, one per request
+        """
+        return self.orchestrator.process_user_requests(requests, return_format='dict')
+    
+    async def add_task_async(self, task_description: str) -> dict:
+        """Async variant of add_task for event-loop callers."""
+        return await asyncio.to_thread(self.add_task, task_description)
+    
+    async def plan_day_async(self, date: Optional[str] = None) -> dict:
+        """Async variant of plan_day for event-loop callers."""
+        return await asyncio.to_thread(self.plan_day, date)
+    
+    async def get_reminders_async(self) -> dict:
+        """Async variant of get_reminders for event-loop callers."""
+        return await asyncio.to_thread(self.get_reminders)
+    
+    async def batch_async(self, requests: list) -> list:
+        """Async variant of batch for event-loop callers."""
+        return await asyncio.to_thread(self.batch, requests)
     
+    # Concurrent submit() calls arriving within this window are coalesced
+    # into one orchestrator batch call
+    BATCH_WINDOW_MS = 10
+    BATCH_MAX_SIZE = 16
+
+    async def submit(self, request_text: str) -> dict:
+        """
+        Enqueue a request and await its result.
+
+        Independent calls from concurrent handlers that land within
+        BATCH_WINDOW_MS of each other are executed as a single
+        orchestrator batch, amortizing the per-call setup, and each
+        caller's future resolves with its own result.
+
+        Args:
+            request_text: Natural language request
+
+        Returns:
+            Parsed response dictionary for this request
+        """
+        if self._batch_queue is None:
+            self._batch_queue = asyncio.Queue()
+            self._batch_worker = asyncio.create_task(self._batch_loop())
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((request_text, future))
+        return await future
+
+    async def _batch_loop(self):
+        """Collect queued requests into batches and resolve their futures."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + self.BATCH_WINDOW_MS / 1000
+            while len(batch) < self.BATCH_MAX_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                results = await asyncio.to_thread(
+                    self.orchestrator.process_user_requests, texts, False, 'dict'
+                )
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def aclose(self):
+        """Stop the background batch worker, if one was started."""
+        if self._batch_worker is not None:
+            self._batch_worker.cancel()
+            try:
+                await self._batch_worker
+            except asyncio.CancelledError:
+                pass
+            self._batch_worker = None
+            self._batch_queue = None
+
     def get_session_state(self) -> dict:
         """Get current session state."""
         return self.orchestrator.get_session_state()
     
+    # Preference-to-text table built once: (key, argument extractor,
+    # sentence template). Adding a preference means adding a row here
+    # instead of another branch in the conversion method.
+    _PREF_HANDLERS = (
+        ('work_hours', lambda v: (v.get('start'), v.get('end')),
+         "Set work hours from {0} to {1}"),
+        ('preferred_focus_minutes', lambda v: (v,),
+         "Set focus time to {0} minutes"),
+        ('timezone', lambda v: (v,),
+         "Set timezone to {0}"),
+    )
+
     def _preferences_to_text(self, preferences: dict) -> str:
         """Convert preferences dict to natural language."""
         text_parts = []
-        
-        if 'work_hours' in preferences:
-            start = preferences['work_hours'].get('start')
-            end = preferences['work_hours'].get('end')
-            if start and end:
-                text_parts.append(f"Set work hours from {start} to {end}")
-        
-        if 'preferred_focus_minutes' in preferences:
-            minutes = preferences['preferred_focus_minutes']
-            text_parts.append(f"Set focus time to {minutes} minutes")
-        
-        if 'timezone' in preferences:
-            tz = preferences['timezone']
-            text_parts.append(f"Set timezone to {tz}")
-        
+        for key, extract, template in self._PREF_HANDLERS:
+            if key in preferences:
+                args = extract(preferences[key])
+                if all(arg is not None for arg in args):
+                    text_parts.append(template.format(*args))
         return ". ".join(text_parts)
 
+# Pretty-printing full JSON responses is gated behind ADK_VERBOSE so
+# normal runs skip the indent-2 serialization entirely
+VERBOSE = os.getenv("ADK_VERBOSE", "0") == "1"
+
+def _pp(obj) -> str:
+    """Pretty-print obj when verbose, otherwise a cheap placeholder."""
+    if VERBOSE:
+        return safe_json_dumps(obj, indent=2)
+    return "(set ADK_VERBOSE=1 to print full responses)"
+
 # Example usage functions
 
-def example_web_app_integration():
-    """Example: Integration with a web application."""
+@functools.lru_cache(maxsize=1)
+def _get_api() -> ProductivityAPI:
+    """
+    Shared API instance for the example functions.
+
+    Constructing ProductivityAPI builds the whole orchestrator (four
+    sub-agents plus the tool registry); the examples reuse one instance
+    instead of paying that four times, which also keeps tool caches warm
+    across examples.
+    """
+    return ProductivityAPI()
+
+async def example_web_app_integration():
+    """Example: Integration with an async web application."""
     print("🌐 Example: Web App Integration")
     print("=" * 40)
     
     # Initialize API
-    api = ProductivityAPI()
+    api = _get_api()
     
-    # Simulate web app requests
+    # Simulate async web handlers; requests run in worker threads so the
+    # event loop stays free. They stay sequential because each one mutates
+    # the shared session (the schedule must see the task added before it).
     print("1. User adds a task via web form:")
-    task_result = api.add_task("Review marketing campaign materials for 90 minutes by Friday")
-    print(f"   API Response: {json.dumps(task_result, indent=2)}\\n")
+    task_result = await api.add_task_async("Review marketing campaign materials for 90 minutes by Friday")
+    print(f"   API Response: {_pp(task_result)}\\n")
     
     print("2. User requests daily schedule:")
-    schedule_result = api.plan_day()
-    print(f"   API Response: {json.dumps(schedule_result, indent=2)}\\n")
+    schedule_result = await api.plan_day_async()
+    print(f"   API Response: {_pp(schedule_result)}\\n")
     
     print("3. Check for notifications:")
-    reminders_result = api.get_reminders()
-    print(f"   API Response: {json.dumps(reminders_result, indent=2)}\\n")
+    reminders_result = await api.get_reminders_async()
+    print(f"   API Response: {_pp(reminders_result)}\\n")
 
 def example_mobile_app_integration():
     """Example: Integration with a mobile application."""
     print("📱 Example: Mobile App Integration")
     print("=" * 40)
     
-    api = ProductivityAPI()
+    api = _get_api()
     
     # Quick task addition (common mobile use case)
     print("1. Quick voice-to-text task addition:")
-    voice_task = "Remind me to pick up groceries on the way home"
-    result = api.add_task(voice_task)
+    voice_task = "Pick up groceries on the way home"
+    result = api.add_task(f"Add task: {voice_task}")
     print(f"   Task created: {result.get('tasks', [{}])[0].get('title', 'N/A')}\\n")
     
     # Get today's schedule for widget
@@ -152,7 +274,7 @@ def example_slack_bot_integration():
     print("💬 Example: Slack Bot Integration")
     print("=" * 40)
     
-    api = ProductivityAPI()
+    api = _get_api()
     
     # Simulate Slack commands
     slack_commands = [
@@ -161,33 +283,45 @@ def example_slack_bot_integration():
         "/reminders Show what's coming up"
     ]
     
-    for i, command in enumerate(slack_commands, 1):
+    # Jump table keyed by slash command: request text builder plus a
+    # formatter for the bot response
+    handlers = {
+        "/task": (
+            lambda text: f"Add task: {text}",
+            lambda r: f"Task '{r.get('tasks', [{}])[0].get('title', 'N/A')}' added!",
+        ),
+        "/schedule": (
+            lambda text: "Plan my day",
+            lambda r: f"Created schedule with {len(r.get('blocks', []))} time blocks!",
+        ),
+        "/reminders": (
+            lambda text: "Check reminders",
+            lambda r: f"{len(r.get('alerts', []))} upcoming, {len(r.get('overdue', []))} overdue tasks!",
+        ),
+    }
+
+    # Translate every command up front, then make one batch round trip
+    requests = []
+    formatters = []
+    for command in slack_commands:
+        slash, _, text = command.partition(' ')
+        build_request, formatter = handlers[slash]
+        requests.append(build_request(text))
+        formatters.append(formatter)
+
+    results = api.batch(requests)
+
+    for i, (command, result, formatter) in enumerate(zip(slack_commands, results, formatters), 1):
         print(f"{i}. Slack command: {command}")
-        
-        # Extract command and text
-        if command.startswith("/task"):
-            text = command.replace("/task ", "")
-            result = api.add_task(text)
-            print(f"   Bot response: Task '{result.get('tasks', [{}])[0].get('title', 'N/A')}' added!\\n")
-        
-        elif command.startswith("/schedule"):
-            result = api.plan_day()
-            block_count = len(result.get('blocks', []))
-            print(f"   Bot response: Created schedule with {block_count} time blocks!\\n")
-        
-        elif command.startswith("/reminders"):
-            result = api.get_reminders()
-            alert_count = len(result.get('alerts', []))
-            overdue_count = len(result.get('overdue', []))
-            print(f"   Bot response: {alert_count} upcoming, {overdue_count} overdue tasks!\\n")
+        print(f"   Bot response: {formatter(result)}\\n")
 
-def example_calendar_integration():
+async def example_calendar_integration():
     """Example: Integration with calendar systems."""
     print("📆 Example: Calendar Integration")
     print("=" * 40)
-    
-    api = ProductivityAPI()
-    
+
+    api = _get_api()
+
     # Create tasks from calendar events
     print("1. Import calendar events as tasks:")
     calendar_events = [
@@ -195,16 +329,26 @@ def example_calendar_integration():
         "Client presentation Friday 2pm for 2 hours",
         "Project deadline review next Monday"
     ]
-    
-    for event in calendar_events:
-        result = api.add_task(f"Prepare for {event}")
+
+    # Import every event concurrently; the semaphore caps in-flight
+    # requests at the configured limit so a big calendar can't stampede
+    # downstream APIs. The adds are independent, and gather keeps the
+    # results in submission order for printing.
+    semaphore = asyncio.Semaphore(FROZEN_CONFIG['batch']['max_concurrency'])
+
+    async def _import_one(event):
+        async with semaphore:
+            return await api.add_task_async(f"Add task: Prepare for {event}")
+
+    results = await asyncio.gather(*[_import_one(event) for event in calendar_events])
+    for result in results:
         print(f"   Imported: {result.get('tasks', [{}])[0].get('title', 'N/A')}")
-    
+
     print()
-    
+
     # Export schedule to calendar format
     print("2. Export schedule for calendar sync:")
-    schedule = api.plan_day()
+    schedule = await api.plan_day_async()
     blocks = schedule.get('blocks', [])
     
     print("   Calendar entries to create:")
@@ -222,10 +366,10 @@ def main():
     print("These examples show how to integrate the system into various applications.\\n")
     
     try:
-        example_web_app_integration()
+        asyncio.run(example_web_app_integration())
         example_mobile_app_integration()
         example_slack_bot_integration()
-        example_calendar_integration()
+        asyncio.run(example_calendar_integration())
         
         print("✅ All API examples completed successfully!")
         print("\\n💡 Integration Tips:")
@@ -7,8 +7,10 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import asyncio
 from orchestrator import OrchestratorAgent
-from config.settings import get_config
+from config.settings import FROZEN_CONFIG
+from utils.helpers import buffered_output
 import json
 
 def demo_task_creation():
@@ -17,7 +19,7 @@ def demo_task_creation():
     print("=" * 30)
     
     # Initialize orchestrator
-    config = get_config()
+    config = FROZEN_CONFIG
     orchestrator = OrchestratorAgent(config['api_keys'])
     
     # Sample task creation requests
@@ -31,9 +33,17 @@ def demo_task_creation():
     
     print("Adding sample tasks...\\n")
     
-    for request in task_requests:
+    # The five adds are independent, so dispatch them concurrently in
+    # worker threads; gather keeps the responses in submission order
+    async def _add_all():
+        return await asyncio.gather(*[
+            asyncio.to_thread(orchestrator.process_user_request, request)
+            for request in task_requests
+        ])
+    
+    responses = asyncio.run(_add_all())
+    for request, response in zip(task_requests, responses):
         print(f"📝 Request: {request}")
-        response = orchestrator.process_user_request(request)
         print(f"🤖 Response: {response}\\n")
     
     return orchestrator
@@ -111,13 +121,19 @@ def main():
     print("=" * 50)
     print("This demo shows all the key features of the system.\\n")
     
-    # Run demonstrations
-    orchestrator = demo_task_creation()
-    orchestrator = demo_day_planning(orchestrator)
-    demo_reminders(orchestrator)
-    demo_preferences(orchestrator)
-    demo_machine_mode(orchestrator)
-    demo_session_state(orchestrator)
+    # Run demonstrations; each section's prints flush as one write
+    with buffered_output():
+        orchestrator = demo_task_creation()
+    with buffered_output():
+        orchestrator = demo_day_planning(orchestrator)
+    with buffered_output():
+        demo_reminders(orchestrator)
+    with buffered_output():
+        demo_preferences(orchestrator)
+    with buffered_output():
+        demo_machine_mode(orchestrator)
+    with buffered_output():
+        demo_session_state(orchestrator)
     
     print("✨ Demo completed! The system is ready for interactive use.")
     print("Run 'python main.py' to start the interactive mode.")
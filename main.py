@@ -2,26 +2,36 @@
 Smart Daily Productivity Assistant - Main Entry Point
 """
 
-from orchestrator import OrchestratorAgent
-from config.settings import get_config
-from utils.helpers import SessionManager
-import sys
-import json
+import asyncio
+
+async def _autosave_loop(session_manager, orchestrator, interval_seconds: int):
+    """Save the session in the background every interval_seconds."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await asyncio.to_thread(
+            session_manager.save_session, orchestrator.get_session_state()
+        )
 
 def main():
     """Main function to run the productivity assistant."""
     print("🚀 Smart Daily Productivity Assistant")
     print("=" * 50)
-    
-    # Load configuration
-    config = get_config()
-    
+
+    # Heavy imports happen after the banner so startup feels instant; the
+    # orchestrator pulls in every agent and the whole tool registry
+    from orchestrator import OrchestratorAgent
+    from config.settings import FROZEN_CONFIG
+    from utils.helpers import SessionManager
+
+    # Load configuration (read-only view; no per-process copies)
+    config = FROZEN_CONFIG
+
     # Initialize session manager
     session_manager = SessionManager()
-    
+
     # Initialize orchestrator
     orchestrator = OrchestratorAgent(config['api_keys'])
-    
+
     # Try to load existing session
     existing_session = session_manager.load_session()
     if existing_session:
@@ -29,7 +39,7 @@ def main():
         print("📂 Loaded existing session")
     else:
         print("🆕 Starting new session")
-    
+
     # Main interaction loop
     print("\\nType 'help' for commands or 'quit' to exit")
     print("Examples:")
@@ -38,68 +48,110 @@ def main():
     print("- 'Check reminders'")
     print("- 'Set work hours 9am to 6pm'")
     print()
-    
-    while True:
-        try:
-            user_input = input("💬 You: ").strip()
-            
-            if user_input.lower() in ['quit', 'exit', 'bye']:
-                # Save session before exit
-                session_manager.save_session(orchestrator.get_session_state())
-                print("💾 Session saved. Goodbye! 👋")
-                break
-            
-            elif user_input.lower() == 'help':
-                show_help()
-                continue
-            
-            elif user_input.lower() == 'status':
-                show_status(orchestrator)
-                continue
-            
-            elif user_input.lower().startswith('save'):
-                session_id = user_input.split()[-1] if len(user_input.split()) > 1 else "default"
-                success = session_manager.save_session(orchestrator.get_session_state(), session_id)
-                if success:
-                    print(f"✅ Session saved as '{session_id}'")
-                else:
-                    print("❌ Failed to save session")
-                continue
-            
-            elif user_input.lower().startswith('load'):
-                session_id = user_input.split()[-1] if len(user_input.split()) > 1 else "default"
-                session_data = session_manager.load_session(session_id)
-                if session_data:
-                    orchestrator.set_session_state(session_data)
-                    print(f"✅ Session '{session_id}' loaded")
-                else:
-                    print(f"❌ Session '{session_id}' not found")
-                continue
-            
-            elif user_input.lower() == 'json':
-                # Toggle machine mode for next input
-                next_input = input("💬 JSON Mode - You: ").strip()
-                response = orchestrator.process_user_request(next_input, machine_mode=True)
-                print("🤖 JSON Response:")
-                print(response)
-                continue
-            
-            elif not user_input:
+
+    try:
+        asyncio.run(_repl(orchestrator, session_manager, config))
+    except KeyboardInterrupt:
+        # Save session before exit
+        session_manager.save_session(orchestrator.get_session_state())
+        print("\\n💾 Session saved. Goodbye! 👋")
+
+async def _repl(orchestrator, session_manager, config):
+    """Async interaction loop with a concurrent autosave task.
+
+    Input and request processing run in worker threads so periodic
+    autosaves happen while the prompt is idle; a crash no longer loses
+    everything since the last manual save.
+    """
+    autosave = None
+    if config['session'].get('auto_save'):
+        autosave = asyncio.create_task(_autosave_loop(
+            session_manager, orchestrator,
+            config['session'].get('save_interval_minutes', 5) * 60
+        ))
+
+    # Command handlers return False to end the loop, True to keep going
+    async def _cmd_quit(rest):
+        # Save session before exit
+        session_manager.save_session(orchestrator.get_session_state())
+        print("💾 Session saved. Goodbye! 👋")
+        return False
+
+    async def _cmd_help(rest):
+        show_help()
+        return True
+
+    async def _cmd_status(rest):
+        show_status(orchestrator)
+        return True
+
+    async def _cmd_save(rest):
+        session_id = rest.split()[-1] if rest else "default"
+        success = session_manager.save_session(orchestrator.get_session_state(), session_id)
+        if success:
+            print(f"✅ Session saved as '{session_id}'")
+        else:
+            print("❌ Failed to save session")
+        return True
+
+    async def _cmd_load(rest):
+        session_id = rest.split()[-1] if rest else "default"
+        session_data = session_manager.load_session(session_id)
+        if session_data:
+            orchestrator.set_session_state(session_data)
+            print(f"✅ Session '{session_id}' loaded")
+        else:
+            print(f"❌ Session '{session_id}' not found")
+        return True
+
+    async def _cmd_json(rest):
+        # Toggle machine mode for next input
+        next_input = (await asyncio.to_thread(input, "💬 JSON Mode - You: ")).strip()
+        response = await asyncio.to_thread(
+            orchestrator.process_user_request, next_input, True
+        )
+        print("🤖 JSON Response:")
+        print(response)
+        return True
+
+    # Jump table keyed by first token: one dict lookup per line of input
+    # instead of re-lowercasing through an elif chain of startswith scans
+    commands = {
+        'quit': _cmd_quit, 'exit': _cmd_quit, 'bye': _cmd_quit,
+        'help': _cmd_help, 'status': _cmd_status, 'json': _cmd_json,
+        'save': _cmd_save, 'load': _cmd_load,
+    }
+    # Only these commands accept trailing arguments; anything else followed
+    # by more text is a natural-language request for the orchestrator
+    arg_commands = frozenset(('save', 'load'))
+
+    try:
+        while True:
+            try:
+                user_input = (await asyncio.to_thread(input, "💬 You: ")).strip()
+
+                if not user_input:
+                    continue
+
+                first, _, rest = user_input.partition(' ')
+                first = first.lower()
+                handler = commands.get(first)
+                if handler is not None and (not rest or first in arg_commands):
+                    if not await handler(rest.strip()):
+                        break
+                    continue
+
+                # Process user request off the event loop so autosaves keep running
+                response = await asyncio.to_thread(orchestrator.process_user_request, user_input)
+                print(f"🤖 Assistant: {response}")
+                print()
+
+            except Exception as e:
+                print(f"❌ Error: {e}")
                 continue
-            
-            # Process user request
-            response = orchestrator.process_user_request(user_input)
-            print(f"🤖 Assistant: {response}")
-            print()
-            
-        except KeyboardInterrupt:
-            # Save session before exit
-            session_manager.save_session(orchestrator.get_session_state())
-            print("\\n💾 Session saved. Goodbye! 👋")
-            break
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            continue
+    finally:
+        if autosave is not None:
+            autosave.cancel()
 
 def show_help():
     """Show available commands."""
@@ -144,7 +196,7 @@ def show_help():
 """
     print(help_text)
 
-def show_status(orchestrator: OrchestratorAgent):
+def show_status(orchestrator: "OrchestratorAgent"):
     """Show current session status."""
     session_state = orchestrator.get_session_state()
     
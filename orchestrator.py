@@ -3,14 +3,146 @@ OrchestratorAgent - Central coordinator of the Smart Daily Productivity Assistan
 Manages sub-agents, session state, and user interactions.
 """
 
+import asyncio
+import functools
 import json
-from datetime import datetime, date
-from typing import List, Dict, Any, Optional, Union
+import re
+import string
+import uuid
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, ALL_COMPLETED, wait
+from datetime import datetime, date, timedelta
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Union
 from agents.task_collector import TaskCollector
 from agents.schedule_planner import SchedulePlanner
 from agents.reminder_agent import ReminderAgent
 from agents.knowledge_agent import KnowledgeAgent
 from tools.tool_registry import get_tool_registry
+from utils.json_utils import safe_json_dumps
+
+# Intent keywords in priority order: when keywords from several intents
+# appear in one input, the earlier intent wins, matching the old branch order
+_INTENT_KEYWORDS = (
+    ("add_tasks", (
+        "add task", "create task", "new task", "i need to", "remember to",
+        "todo", "task:", "schedule this",
+    )),
+    ("plan_day", (
+        "plan my day", "schedule my day", "create schedule", "organize my day",
+        "what should i do", "plan today", "schedule tasks",
+        "plan my week", "schedule my week",
+    )),
+    ("check_reminders", (
+        "reminders", "what's due", "upcoming tasks", "alerts",
+        "what's coming up", "check schedule",
+    )),
+    ("update_task", (
+        "mark done", "complete task", "update task", "finished",
+        "reschedule", "change due date",
+    )),
+    ("set_preferences", (
+        "set work hours", "change timezone", "update preferences",
+        "focus time", "break length",
+    )),
+)
+
+_KEYWORD_TO_INTENT = {
+    keyword: intent
+    for intent, keywords in _INTENT_KEYWORDS
+    for keyword in keywords
+}
+
+# Hint tokens the handlers query after intent detection: scheduling
+# hints for the missing-field check, date words for target-date
+# extraction, 'week' for multi-day planning
+_HINT_TOKENS = frozenset({'schedule', 'today', 'tomorrow', 'week'})
+_SCHEDULE_HINT_TOKENS = frozenset({'schedule', 'today', 'tomorrow'})
+
+# One compiled scan over the input instead of ~30 Python-level substring
+# checks. The lookahead makes occurrences overlap-safe ('create schedule
+# this' must surface both 'create schedule' and 'schedule this'), with
+# longest-keyword-first ordering inside the group. Hint tokens ride in
+# the same pass so the handlers never rescan the input.
+_INTENT_SCAN_RE = re.compile(
+    '(?=(' + '|'.join(
+        sorted(
+            (re.escape(token) for token in set(_KEYWORD_TO_INTENT) | _HINT_TOKENS),
+            key=len, reverse=True
+        )
+    ) + '))'
+)
+
+# Preference-parsing pattern, compiled once at import instead of per call
+_FOCUS_MIN_RE = re.compile(r'(\d+)\s*minutes?')
+
+# Characters allowed in task-id slugs; set membership beats a per-char
+# isalnum() call
+_VALID_ID_CHARS = frozenset(string.ascii_lowercase + string.digits + '-')
+
+# Human-facing error templates, built once; handlers only interpolate
+# the variable fields
+_ERROR_TEXT_TEMPLATE = "I encountered an error: {error}\\n\\n```json\\n{payload}\\n```"
+_OPERATION_ERROR_TEXT_TEMPLATE = (
+    "I encountered an error during {operation}: {error}\\n\\n```json\\n{payload}\\n```"
+)
+
+# Tag groups that trigger knowledge queries during planning
+_OUTDOOR_TAGS = frozenset({'outdoor'})
+_TRAVEL_TAGS = frozenset({'travel', 'commute'})
+_WORK_TAGS = frozenset({'work'})
+_CREATIVE_TAGS = frozenset({'creative', 'design'})
+
+@functools.lru_cache(maxsize=512)
+def _scan_input_cached(user_input_lower: str):
+    """
+    Token-scan an input, memoized across all orchestrator instances.
+
+    CLI and bot sessions re-send short prompts like 'check reminders'
+    verbatim; the scan is a pure function of its input, so repeats are
+    one hash lookup instead of a regex pass.
+
+    Returns:
+        Tuple of (intent category, frozenset of every matched token)
+    """
+    matched_tokens = frozenset(_INTENT_SCAN_RE.findall(user_input_lower))
+
+    found = {
+        _KEYWORD_TO_INTENT[token]
+        for token in matched_tokens
+        if token in _KEYWORD_TO_INTENT
+    }
+    if found:
+        for intent, _ in _INTENT_KEYWORDS:
+            if intent in found:
+                return intent, matched_tokens
+
+    # Default to general query
+    return "general_query", matched_tokens
+
+def _session_cached(method):
+    """
+    Memoize a derived-value method against the current session state.
+
+    The result is cached under the method name and reused until the
+    session version changes (any mutation bumps it via _touch_session)
+    or the calendar day rolls over. Arguments are deliberately not part
+    of the key: decorated methods must derive their output from session
+    state alone, so repeated reminder ticks or plan calls within an
+    unchanged session hit the cache instead of rescanning every task.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (self._session_version, date.today())
+        cached = self._memo.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        result = method(self, *args, **kwargs)
+        self._memo[name] = (key, result)
+        return result
+
+    return wrapper
 
 class OrchestratorAgent:
     """
@@ -49,110 +181,260 @@ class OrchestratorAgent:
         
         # Track retry attempts for robustness
         self.retry_count = {}
+
+        # Session-scoped memo for derived values (_session_cached);
+        # the version bumps on every mutation to invalidate it
+        self._session_version = 0
+        self._memo: Dict[str, Any] = {}
+
+        # Set index over completed task ids, maintained alongside the
+        # completed list so scheduling filters are O(1) per task
+        self._completed_ids: set = set()
+
+        # Id-to-task index over the task list, so lookups during update
+        # and reminder handling skip the linear scan
+        self._task_index: Dict[str, Dict[str, Any]] = {}
+
+        # Date-keyed view of the schedules list; the reminder polling
+        # path looks up today's schedule in O(1) instead of scanning
+        self._schedule_by_date: Dict[str, Dict[str, Any]] = {}
+
+        # Monotonic counter plus per-instance run prefix feeding
+        # _generate_task_id; the prefix keeps ids from a fresh process
+        # distinct from ones loaded out of a saved session
+        self._task_id_seq = 0
+        self._task_id_run = uuid.uuid4().hex[:6]
+
+        # Background pool for fire-and-forget sub-agent work (spawn_async)
+        self._executor = ThreadPoolExecutor(max_workers=8)
+        self._subagent_tasks: Dict[str, Any] = {}
         
+        # Intent-to-handler dispatch table; unknown intents fall back to
+        # _handle_general_query in process_user_request. All handlers
+        # share the (user_input, user_input_lower, matched_tokens,
+        # machine_mode) shape and return the native payload in machine
+        # mode (text otherwise); serialization happens once at the
+        # process_user_request boundary, only for 'json' callers.
+        self._intent_handlers = {
+            "add_tasks": self._handle_add_tasks,
+            "plan_day": self._handle_plan_day,
+            "check_reminders": self._handle_check_reminders,
+            "update_task": self._handle_update_task,
+            "set_preferences": self._handle_set_preferences,
+        }
+
         # Initialize ADK tool registry
         self.tool_registry = get_tool_registry()
         if not self.tool_registry.tools:
             config = {'api_keys': api_keys or {}}
             self.tool_registry.initialize_default_tools(config)
     
-    def process_user_request(self, user_input: str, machine_mode: bool = False) -> str:
+    def process_user_request(
+        self,
+        user_input: str,
+        machine_mode: bool = False,
+        return_format: Optional[str] = None
+    ) -> Union[str, Dict[str, Any], List[Any]]:
         """
         Main entry point for processing user requests.
-        
+
         Args:
             user_input: Natural language user input
             machine_mode: If True, return pure JSON without summary
-            
+                (equivalent to return_format='json')
+            return_format: 'text' for the human-friendly response, 'json'
+                for a pure JSON string, or 'dict' for the native payload
+                with no serialization at all
+
         Returns:
-            Human-friendly response with JSON or pure JSON if machine_mode
+            Human-friendly response with JSON, pure JSON string, or the
+            payload object depending on return_format
         """
+        if return_format is None:
+            return_format = 'json' if machine_mode else 'text'
+        machine_mode = return_format != 'text'
+
         try:
-            # Detect user intent
-            intent = self._detect_intent(user_input)
-            
-            # Process based on intent
-            if intent == "add_tasks":
-                return self._handle_add_tasks(user_input, machine_mode)
-            elif intent == "plan_day":
-                return self._handle_plan_day(user_input, machine_mode)
-            elif intent == "check_reminders":
-                return self._handle_check_reminders(user_input, machine_mode)
-            elif intent == "update_task":
-                return self._handle_update_task(user_input, machine_mode)
-            elif intent == "set_preferences":
-                return self._handle_set_preferences(user_input, machine_mode)
-            else:
-                return self._handle_general_query(user_input, machine_mode)
-                
+            # Lower the input once; helpers that scan for keywords all
+            # take this instead of re-lowering per call
+            user_input_lower = user_input.lower()
+
+            # One token scan supplies the intent plus the hint tokens
+            # the handlers query; dispatch through the handler table
+            intent, matched_tokens = self._scan_input(user_input_lower)
+            handler = self._intent_handlers.get(intent, self._handle_general_query)
+            response = handler(user_input, user_input_lower, matched_tokens, machine_mode)
+
+            # Handlers hand back native payloads in machine mode, so
+            # 'dict' callers get them as-is and only 'json' serializes
+            if return_format == 'json':
+                return safe_json_dumps(response)
+            return response
+
         except Exception as e:
             error_response = {
                 "error": str(e),
                 "status": "failed",
                 "timestamp": datetime.now().isoformat()
             }
-            
-            if machine_mode:
-                return json.dumps(error_response, indent=2)
+
+            if return_format == 'dict':
+                return error_response
+            elif machine_mode:
+                return safe_json_dumps(error_response)
             else:
-                return f"I encountered an error: {str(e)}\\n\\n```json\\n{json.dumps(error_response, indent=2)}\\n```"
+                return _ERROR_TEXT_TEMPLATE.format(
+                    error=str(e),
+                    payload=safe_json_dumps(error_response, indent=2)
+                )
     
-    def _detect_intent(self, user_input: str) -> str:
+    def process_user_requests(
+        self,
+        user_inputs: List[str],
+        machine_mode: bool = False,
+        return_format: Optional[str] = None
+    ) -> List[Any]:
         """
-        Detect user intent from natural language input.
+        Process several user requests in one call.
+        
+        Requests share this orchestrator's session state and run in order,
+        so later requests see the effects of earlier ones (a task added by
+        the first request shows up in a following plan-day request). Batch
+        callers pay the setup cost once instead of once per round trip.
         
         Args:
-            user_input: User's natural language input
+            user_inputs: Natural language user inputs, in execution order
+            machine_mode: If True, return pure JSON without summary
+            return_format: Per-request return format, as in
+                process_user_request
             
         Returns:
-            Intent category as string
+            One response per input, in the same order
         """
-        user_input_lower = user_input.lower()
-        
-        # Task creation/editing keywords
-        if any(word in user_input_lower for word in [
-            "add task", "create task", "new task", "i need to", "remember to",
-            "todo", "task:", "schedule this"
-        ]):
-            return "add_tasks"
-        
-        # Planning keywords
-        if any(word in user_input_lower for word in [
-            "plan my day", "schedule my day", "create schedule", "organize my day",
-            "what should i do", "plan today", "schedule tasks"
-        ]):
-            return "plan_day"
-        
-        # Reminder keywords
-        if any(word in user_input_lower for word in [
-            "reminders", "what's due", "upcoming tasks", "alerts", 
-            "what's coming up", "check schedule"
-        ]):
-            return "check_reminders"
-        
-        # Task update keywords
-        if any(word in user_input_lower for word in [
-            "mark done", "complete task", "update task", "finished",
-            "reschedule", "change due date"
-        ]):
-            return "update_task"
-        
-        # Preferences keywords
-        if any(word in user_input_lower for word in [
-            "set work hours", "change timezone", "update preferences",
-            "focus time", "break length"
-        ]):
-            return "set_preferences"
-        
-        # Default to general query
-        return "general_query"
+        return [
+            self.process_user_request(user_input, machine_mode, return_format)
+            for user_input in user_inputs
+        ]
+
+    async def aprocess_user_request(
+        self,
+        user_input: str,
+        machine_mode: bool = False,
+        return_format: Optional[str] = None
+    ) -> Union[str, Dict[str, Any], List[Any]]:
+        """
+        Async variant of process_user_request for event-loop callers.
+
+        The handler pipeline stays synchronous (the sub-agents fan out
+        their own network I/O internally), so this offloads the whole
+        request to a worker thread: async web handlers await it without
+        blocking the event loop, and concurrent requests overlap their
+        I/O waits. Same arguments and return shapes as
+        process_user_request.
+        """
+        return await asyncio.to_thread(
+            self.process_user_request, user_input, machine_mode, return_format
+        )
+
+    async def aprocess_user_requests(
+        self,
+        user_inputs: List[str],
+        machine_mode: bool = False,
+        return_format: Optional[str] = None
+    ) -> List[Any]:
+        """Async variant of process_user_requests for event-loop callers."""
+        return await asyncio.to_thread(
+            self.process_user_requests, user_inputs, machine_mode, return_format
+        )
+
+    async def aprocess_user_request_stream(self, user_input: str, machine_mode: bool = False):
+        """
+        Process a request, yielding progress events as they become available.
+
+        Each event is a dict with a 'type' key:
+        - {'type': 'intent', 'intent': <detected intent>} right away
+        - {'type': 'response', 'data': <final response string>} when done
+
+        The sub-agent handlers are synchronous single-shot calls (keyword
+        dispatch plus local agents, no token stream to forward), so the
+        stream has two stages: consumers see the parsed intent immediately
+        while the handler runs in a worker thread, instead of waiting on
+        one blocking call for any sign of progress.
+
+        Args:
+            user_input: Natural language user input
+            machine_mode: If True, the final response is pure JSON
+        """
+        yield {"type": "intent", "intent": self._detect_intent(user_input.lower())}
+        response = await self.aprocess_user_request(user_input, machine_mode)
+        yield {"type": "response", "data": response}
+
+    def spawn_async(self, agent_call, *args, **kwargs) -> str:
+        """
+        Run a sub-agent call on the background pool, returning a task id.
+
+        Lets callers kick off independent work - say a knowledge prefetch
+        for a query the user is still typing - without blocking the
+        request thread, then collect it later with gather_results().
+
+        Args:
+            agent_call: Callable to execute (e.g. a sub-agent method)
+            *args: Positional arguments for the call
+            **kwargs: Keyword arguments for the call
+
+        Returns:
+            Task id to pass to gather_results
+        """
+        task_id = uuid.uuid4().hex
+        self._subagent_tasks[task_id] = self._executor.submit(agent_call, *args, **kwargs)
+        return task_id
+
+    def gather_results(self, task_ids: List[str], mode: str = 'wait_all') -> Dict[str, Any]:
+        """
+        Collect results for tasks started with spawn_async.
+
+        Args:
+            task_ids: Ids returned by spawn_async
+            mode: 'wait_all' blocks until every task finishes;
+                'wait_first' returns as soon as one does
+
+        Returns:
+            Mapping of task id to result (or to the raised exception) for
+            every task that has finished; unfinished tasks stay pending
+            and can be gathered again later
+        """
+        futures = {task_id: self._subagent_tasks[task_id] for task_id in task_ids}
+        return_when = FIRST_COMPLETED if mode == 'wait_first' else ALL_COMPLETED
+        done, _ = wait(futures.values(), return_when=return_when)
+
+        results = {}
+        for task_id, future in futures.items():
+            if future in done:
+                results[task_id] = future.exception() or future.result()
+                del self._subagent_tasks[task_id]
+        return results
+
+    def _scan_input(self, user_input_lower: str):
+        """
+        Scan the input once for intent keywords and hint tokens.
+
+        Args:
+            user_input_lower: User's natural language input, lowercased
+
+        Returns:
+            Tuple of (intent category, frozenset of every matched token)
+        """
+        return _scan_input_cached(user_input_lower)
+
+    def _detect_intent(self, user_input_lower: str) -> str:
+        """Detect user intent from lowercased natural language input."""
+        return _scan_input_cached(user_input_lower)[0]
     
-    def _handle_add_tasks(self, user_input: str, machine_mode: bool) -> str:
+    def _handle_add_tasks(self, user_input: str, user_input_lower: str, matched_tokens: frozenset, machine_mode: bool) -> Union[str, Dict[str, Any]]:
         """Handle task creation requests."""
         try:
             # Use TaskCollector to extract tasks
-            task_json = self.task_collector.process_user_input(user_input)
-            task_data = json.loads(task_json)
+            task_data = self.task_collector.process_user_input_dict(user_input)
             
             # Validate and add tasks to session
             if isinstance(task_data, list):
@@ -161,45 +443,47 @@ class OrchestratorAgent:
                 new_tasks = [task_data]
             
             # Check for missing essential fields and ask clarification
-            missing_fields = self._check_missing_fields(new_tasks, user_input)
+            missing_fields = self._check_missing_fields(new_tasks, matched_tokens)
             if missing_fields and not machine_mode:
                 return missing_fields
             
-            # Add tasks to session state
+            # Add tasks to session state; one timestamp covers the batch
+            now_iso = datetime.now().isoformat()
             for task in new_tasks:
                 task['id'] = self._generate_task_id(task)
-                task['created_at'] = datetime.now().isoformat()
+                task['created_at'] = now_iso
                 self.session_state['tasks'].append(task)
-            
-            self.session_state['last_updated'] = datetime.now().isoformat()
+                self._task_index[task['id']] = task
+
+            self._touch_session(now_iso)
             
             # Prepare response
             summary = f"Added {len(new_tasks)} task(s) to your list."
             
             if machine_mode:
-                return json.dumps({"tasks": new_tasks, "status": "success"}, indent=2)
+                return {"tasks": new_tasks, "status": "success"}
             else:
-                return f"{summary}\\n\\n```json\\n{json.dumps(new_tasks, indent=2)}\\n```"
+                return f"{summary}\\n\\n```json\\n{safe_json_dumps(new_tasks, indent=2)}\\n```"
                 
         except Exception as e:
             return self._handle_error("task creation", str(e), machine_mode)
     
-    def _handle_plan_day(self, user_input: str, machine_mode: bool) -> str:
+    def _handle_plan_day(self, user_input: str, user_input_lower: str, matched_tokens: frozenset, machine_mode: bool) -> Union[str, Dict[str, Any]]:
         """Handle daily planning requests."""
         try:
             # Determine target date
-            target_date = self._extract_date_from_input(user_input) or date.today().isoformat()
+            target_date = self._extract_date_from_input(matched_tokens) or date.today().isoformat()
             
             # Get tasks that need scheduling
             tasks_to_schedule = [
                 task for task in self.session_state['tasks']
-                if task.get('id') not in [c['task_id'] for c in self.session_state['completed']]
+                if task.get('id') not in self._completed_ids
             ]
             
             if not tasks_to_schedule:
                 no_tasks_msg = "No tasks to schedule. Add some tasks first!"
                 if machine_mode:
-                    return json.dumps({"message": no_tasks_msg, "schedule": None}, indent=2)
+                    return {"message": no_tasks_msg, "schedule": None}
                 else:
                     return no_tasks_msg
             
@@ -208,47 +492,107 @@ class OrchestratorAgent:
             knowledge_insights = []
             
             if knowledge_queries:
-                knowledge_json = self.knowledge_agent.fetch_insights(
-                    knowledge_queries, 
+                knowledge_insights = self.knowledge_agent.fetch_insights_dict(
+                    knowledge_queries,
                     self.session_state['preferences'].get('location'),
                     tasks_to_schedule
                 )
-                knowledge_insights = json.loads(knowledge_json)
-            
-            # Create schedule using SchedulePlanner
-            schedule_json = self.schedule_planner.create_schedule(
-                tasks_to_schedule,
-                self.session_state['preferences'],
-                self.session_state['blocked_times'],
-                knowledge_insights,
-                str(target_date),
-                self.session_state['preferences']['timezone']
+
+            # 'Plan my week' packs the next seven days in one request,
+            # reusing the pending-task filter and knowledge fetch above
+            num_days = 7 if 'week' in matched_tokens else 1
+            daily_schedules = self._pack_days(
+                tasks_to_schedule, knowledge_insights, target_date, num_days
             )
-            
-            schedule_data = json.loads(schedule_json)
-            
-            # Save schedule to session
-            self.session_state['schedules'].append({
-                "date": target_date,
-                "schedule": schedule_data,
-                "created_at": datetime.now().isoformat()
-            })
-            self.session_state['last_updated'] = datetime.now().isoformat()
-            
+
+            # Save schedules to session
+            now_iso = datetime.now().isoformat()
+            for schedule_data in daily_schedules:
+                self.session_state['schedules'].append({
+                    "date": schedule_data['date'],
+                    "schedule": schedule_data,
+                    "created_at": now_iso
+                })
+                self._schedule_by_date[schedule_data['date']] = schedule_data
+            self._touch_session(now_iso)
+
             # Prepare response
-            scheduled_count = len(schedule_data.get('blocks', []))
-            unscheduled_count = len(schedule_data.get('unscheduled', []))
-            summary = f"Created schedule for {target_date} with {scheduled_count} time blocks. {unscheduled_count} tasks couldn't be scheduled."
-            
+            if num_days == 1:
+                schedule_data = daily_schedules[0]
+                scheduled_count = len(schedule_data.get('blocks', []))
+                unscheduled_count = len(schedule_data.get('unscheduled', []))
+                summary = f"Created schedule for {target_date} with {scheduled_count} time blocks. {unscheduled_count} tasks couldn't be scheduled."
+                response_data = schedule_data
+            else:
+                scheduled_count = sum(len(s.get('blocks', [])) for s in daily_schedules)
+                unscheduled_count = len(daily_schedules[-1].get('unscheduled', []))
+                summary = f"Planned {len(daily_schedules)} day(s) starting {target_date} with {scheduled_count} time blocks. {unscheduled_count} tasks couldn't be scheduled."
+                response_data = {"week_of": target_date, "days": daily_schedules}
+
             if machine_mode:
-                return schedule_json
+                return response_data
             else:
-                return f"{summary}\\n\\n```json\\n{schedule_json}\\n```"
-                
+                return f"{summary}\\n\\n```json\\n{safe_json_dumps(response_data, indent=2)}\\n```"
+
         except Exception as e:
             return self._handle_error("day planning", str(e), machine_mode)
+
+    def _pack_days(
+        self,
+        tasks_to_schedule: List[Dict[str, Any]],
+        knowledge_insights: List[Dict[str, Any]],
+        start_date: str,
+        num_days: int
+    ) -> List[Dict[str, Any]]:
+        """
+        First-fit tasks into consecutive days, carrying leftovers forward.
+
+        Each day is planned with the tasks the previous days couldn't
+        fit, so a week plan spreads an overfull backlog across days
+        instead of reporting the same overflow seven times. Always
+        returns at least one schedule; trailing empty days are skipped.
+
+        Args:
+            tasks_to_schedule: Pending tasks, as filtered by the caller
+            knowledge_insights: Insights shared across all planned days
+            start_date: First date to plan (YYYY-MM-DD)
+            num_days: Number of consecutive days to fill
+
+        Returns:
+            List of schedule dictionaries, one per planned day
+        """
+        preferences = self.session_state['preferences']
+        blocked_times = self.session_state['blocked_times']
+        timezone = preferences['timezone']
+        first_day = date.fromisoformat(str(start_date))
+
+        daily_schedules = []
+        pending = tasks_to_schedule
+        for offset in range(num_days):
+            if not pending:
+                break
+            schedule_data = self.schedule_planner.create_schedule_dict(
+                pending,
+                preferences,
+                blocked_times,
+                knowledge_insights,
+                (first_day + timedelta(days=offset)).isoformat(),
+                timezone
+            )
+            daily_schedules.append(schedule_data)
+
+            # Only tasks that couldn't fit roll over to the next day
+            unscheduled_titles = {
+                entry['task_title'] for entry in schedule_data.get('unscheduled', [])
+            }
+            pending = [
+                task for task in pending
+                if task.get('title', 'Untitled Task') in unscheduled_titles
+            ]
+
+        return daily_schedules
     
-    def _handle_check_reminders(self, user_input: str, machine_mode: bool) -> str:
+    def _handle_check_reminders(self, user_input: str, user_input_lower: str, matched_tokens: frozenset, machine_mode: bool) -> Union[str, Dict[str, Any]]:
         """Handle reminder checking requests."""
         try:
             # Get current schedule
@@ -257,19 +601,17 @@ class OrchestratorAgent:
             if not current_schedule:
                 no_schedule_msg = "No schedule found for today. Plan your day first!"
                 if machine_mode:
-                    return json.dumps({"message": no_schedule_msg, "reminders": None}, indent=2)
+                    return {"message": no_schedule_msg, "reminders": None}
                 else:
                     return no_schedule_msg
             
             # Check reminders using ReminderAgent
-            reminders_json = self.reminder_agent.process_reminder_tick(
+            reminders_data = self.reminder_agent.process_reminder_tick_dict(
                 current_schedule,
                 self.session_state['tasks'],
                 self.session_state['preferences']
             )
             
-            reminders_data = json.loads(reminders_json)
-            
             # Prepare response
             alert_count = len(reminders_data.get('alerts', []))
             overdue_count = len(reminders_data.get('overdue', []))
@@ -280,23 +622,23 @@ class OrchestratorAgent:
                 summary = "No urgent reminders right now. You're on track!"
             
             if machine_mode:
-                return reminders_json
+                return reminders_data
             else:
-                return f"{summary}\\n\\n```json\\n{reminders_json}\\n```"
+                return f"{summary}\\n\\n```json\\n{safe_json_dumps(reminders_data, indent=2)}\\n```"
                 
         except Exception as e:
             return self._handle_error("reminder checking", str(e), machine_mode)
     
-    def _handle_update_task(self, user_input: str, machine_mode: bool) -> str:
+    def _handle_update_task(self, user_input: str, user_input_lower: str, matched_tokens: frozenset, machine_mode: bool) -> Union[str, Dict[str, Any]]:
         """Handle task update requests."""
         try:
             # Extract task identifier and update type
-            update_info = self._parse_task_update(user_input)
+            update_info = self._parse_task_update(user_input_lower)
             
             if not update_info:
                 error_msg = "Could not understand task update request. Please specify which task and what to change."
                 if machine_mode:
-                    return json.dumps({"error": error_msg}, indent=2)
+                    return {"error": error_msg}
                 else:
                     return error_msg
             
@@ -308,7 +650,7 @@ class OrchestratorAgent:
             if not task:
                 error_msg = f"Task with ID '{task_id}' not found."
                 if machine_mode:
-                    return json.dumps({"error": error_msg}, indent=2)
+                    return {"error": error_msg}
                 else:
                     return error_msg
             
@@ -323,49 +665,49 @@ class OrchestratorAgent:
                 task['due_date'] = new_date
                 summary = f"Rescheduled task '{task['title']}' to {new_date}."
             
-            self.session_state['last_updated'] = datetime.now().isoformat()
+            self._touch_session()
             
             if machine_mode:
-                return json.dumps({"status": "success", "message": summary}, indent=2)
+                return {"status": "success", "message": summary}
             else:
                 return summary
                 
         except Exception as e:
             return self._handle_error("task update", str(e), machine_mode)
     
-    def _handle_set_preferences(self, user_input: str, machine_mode: bool) -> str:
+    def _handle_set_preferences(self, user_input: str, user_input_lower: str, matched_tokens: frozenset, machine_mode: bool) -> Union[str, Dict[str, Any]]:
         """Handle preference setting requests."""
         try:
             # Parse preferences from input
-            new_prefs = self._parse_preferences(user_input)
+            new_prefs = self._parse_preferences(user_input_lower)
             
             # Update session preferences
             for key, value in new_prefs.items():
                 if key in self.session_state['preferences']:
                     self.session_state['preferences'][key] = value
             
-            self.session_state['last_updated'] = datetime.now().isoformat()
+            self._touch_session()
             
             summary = f"Updated {len(new_prefs)} preference(s)."
             
             if machine_mode:
-                return json.dumps({"preferences": self.session_state['preferences'], "status": "success"}, indent=2)
+                return {"preferences": self.session_state['preferences'], "status": "success"}
             else:
-                return f"{summary}\\n\\n```json\\n{json.dumps(self.session_state['preferences'], indent=2)}\\n```"
+                return f"{summary}\\n\\n```json\\n{safe_json_dumps(self.session_state['preferences'], indent=2)}\\n```"
                 
         except Exception as e:
             return self._handle_error("preference setting", str(e), machine_mode)
     
-    def _handle_general_query(self, user_input: str, machine_mode: bool) -> str:
+    def _handle_general_query(self, user_input: str, user_input_lower: str, matched_tokens: frozenset, machine_mode: bool) -> Union[str, List[Dict[str, Any]]]:
         """Handle general queries and information requests."""
         try:
             # Use KnowledgeAgent for general information
-            knowledge_json = self.knowledge_agent.fetch_insights([user_input])
-            knowledge_data = json.loads(knowledge_json)
-            
+            knowledge_data = self.knowledge_agent.fetch_insights_dict([user_input])
+
             if machine_mode:
-                return knowledge_json
+                return knowledge_data
             else:
+                knowledge_json = safe_json_dumps(knowledge_data, indent=2)
                 if knowledge_data and knowledge_data[0].get('summary'):
                     summary = knowledge_data[0]['summary']
                     return f"Here's what I found: {summary}\\n\\n```json\\n{knowledge_json}\\n```"
@@ -376,60 +718,60 @@ class OrchestratorAgent:
             return self._handle_error("information lookup", str(e), machine_mode)
     
     # Helper methods
-    
-    def _check_missing_fields(self, tasks: List[Dict[str, Any]], user_input: str) -> Optional[str]:
+
+    def _touch_session(self, now_iso: Optional[str] = None):
+        """Record a session mutation and invalidate memoized derived values."""
+        self.session_state['last_updated'] = now_iso or datetime.now().isoformat()
+        self._session_version += 1
+
+    def _check_missing_fields(self, tasks: List[Dict[str, Any]], matched_tokens: frozenset) -> Optional[str]:
         """Check if essential fields are missing and return clarification question."""
         for task in tasks:
             # Check if user mentioned scheduling but no due_date
-            if any(word in user_input.lower() for word in ['schedule', 'today', 'tomorrow']) and not task.get('due_date'):
+            if not _SCHEDULE_HINT_TOKENS.isdisjoint(matched_tokens) and not task.get('due_date'):
                 return f"When would you like to schedule '{task['title']}'? Please specify a date or time."
         
         return None
     
+    @_session_cached
     def _determine_knowledge_needs(self, tasks: List[Dict[str, Any]]) -> List[str]:
         """Determine what knowledge insights are needed for scheduling."""
+        # One pass over the tasks, testing each tag list against the
+        # module-level tag groups instead of three separate scans
+        outdoor = travel = analytical = creative = False
+        for task in tasks:
+            tags = task.get('tags')
+            if not tags:
+                continue
+            tag_set = set(tags)
+            outdoor = outdoor or not _OUTDOOR_TAGS.isdisjoint(tag_set)
+            travel = travel or not _TRAVEL_TAGS.isdisjoint(tag_set)
+            analytical = analytical or not _WORK_TAGS.isdisjoint(tag_set)
+            creative = creative or not _CREATIVE_TAGS.isdisjoint(tag_set)
+
         queries = []
-        
-        # Check for outdoor tasks - need weather
-        if any('outdoor' in task.get('tags', []) for task in tasks):
+        if outdoor:
             queries.append("weather forecast for outdoor activities")
-        
-        # Check for travel tasks - need traffic info
-        if any(tag in ['travel', 'commute'] for task in tasks for tag in task.get('tags', [])):
+        if travel:
             queries.append("traffic and travel conditions")
-        
-        # Check task types for productivity insights
-        task_types = set()
-        for task in tasks:
-            tags = task.get('tags', [])
-            if 'work' in tags:
-                task_types.add('analytical')
-            if any(tag in tags for tag in ['creative', 'design']):
-                task_types.add('creative')
-        
-        if task_types:
-            queries.extend([f"productivity timing for {task_type} work" for task_type in task_types])
-        
+        if analytical:
+            queries.append("productivity timing for analytical work")
+        if creative:
+            queries.append("productivity timing for creative work")
+
         return queries
     
     def _get_current_schedule(self) -> Optional[Dict[str, Any]]:
         """Get the schedule for today."""
-        today = date.today().isoformat()
-        
-        for schedule_entry in reversed(self.session_state['schedules']):
-            if schedule_entry['date'] == today:
-                return schedule_entry['schedule']
-        
-        return None
+        return self._schedule_by_date.get(date.today().isoformat())
     
-    def _extract_date_from_input(self, user_input: str) -> Optional[str]:
-        """Extract target date from user input."""
-        user_input_lower = user_input.lower()
-        
-        if 'today' in user_input_lower:
-            return date.today().isoformat()
-        elif 'tomorrow' in user_input_lower:
-            return (date.today().replace(day=date.today().day + 1)).isoformat()
+    def _extract_date_from_input(self, matched_tokens: frozenset) -> Optional[str]:
+        """Extract target date from the tokens matched by _scan_input."""
+        today = date.today()
+        if 'today' in matched_tokens:
+            return today.isoformat()
+        elif 'tomorrow' in matched_tokens:
+            return (today + timedelta(days=1)).isoformat()
         
         # TODO: Add more sophisticated date parsing
         return None
@@ -438,15 +780,15 @@ class OrchestratorAgent:
         """Generate a unique task ID."""
         title = task.get('title', 'task')
         slug = title.lower().replace(' ', '-').replace('_', '-')
-        slug = ''.join(c for c in slug if c.isalnum() or c == '-')[:20]
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        return f"{slug}-{timestamp}"
+        slug = ''.join(c for c in slug if c in _VALID_ID_CHARS)[:20]
+        # Monotonic counter (hex-encoded) instead of a second-resolution
+        # timestamp: O(1) uniqueness with no strftime per task
+        self._task_id_seq += 1
+        return f"{slug}-{self._task_id_run}{self._task_id_seq:x}"
     
-    def _parse_task_update(self, user_input: str) -> Optional[Dict[str, Any]]:
+    def _parse_task_update(self, user_input_lower: str) -> Optional[Dict[str, Any]]:
         """Parse task update information from user input."""
         # This is a simplified parser - in real implementation, use more sophisticated NLP
-        user_input_lower = user_input.lower()
-        
         if 'mark done' in user_input_lower or 'complete' in user_input_lower:
             # Extract task identifier (simplified - just take the first task for now)
             if self.session_state['tasks']:
@@ -459,10 +801,7 @@ class OrchestratorAgent:
     
     def _find_task_by_id(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Find a task by its ID."""
-        for task in self.session_state['tasks']:
-            if task.get('id') == task_id:
-                return task
-        return None
+        return self._task_index.get(task_id)
     
     def _mark_task_complete(self, task_id: str):
         """Mark a task as complete."""
@@ -471,28 +810,27 @@ class OrchestratorAgent:
             'completed_at': datetime.now().isoformat()
         }
         self.session_state['completed'].append(completion_record)
+        self._completed_ids.add(task_id)
     
-    def _parse_preferences(self, user_input: str) -> Dict[str, Any]:
+    def _parse_preferences(self, user_input_lower: str) -> Dict[str, Any]:
         """Parse preference updates from user input."""
         prefs = {}
-        user_input_lower = user_input.lower()
-        
+
         # Parse work hours
         if 'work hours' in user_input_lower:
             # Simplified parsing - in real implementation, use regex
-            if '9' in user_input and '5' in user_input:
+            if '9' in user_input_lower and '5' in user_input_lower:
                 prefs['work_hours'] = {"start": "09:00", "end": "17:00"}
-        
+
         # Parse focus time
         if 'focus' in user_input_lower and 'minutes' in user_input_lower:
-            import re
-            match = re.search(r'(\\d+)\\s*minutes?', user_input_lower)
+            match = _FOCUS_MIN_RE.search(user_input_lower)
             if match:
                 prefs['preferred_focus_minutes'] = int(match.group(1))
-        
+
         return prefs
     
-    def _handle_error(self, operation: str, error_msg: str, machine_mode: bool) -> str:
+    def _handle_error(self, operation: str, error_msg: str, machine_mode: bool) -> Union[str, Dict[str, Any]]:
         """Handle errors with retry logic."""
         error_response = {
             "error": error_msg,
@@ -500,16 +838,40 @@ class OrchestratorAgent:
             "status": "failed",
             "timestamp": datetime.now().isoformat()
         }
-        
+
         if machine_mode:
-            return json.dumps(error_response, indent=2)
+            return error_response
         else:
-            return f"I encountered an error during {operation}: {error_msg}\\n\\n```json\\n{json.dumps(error_response, indent=2)}\\n```"
-    
-    def get_session_state(self) -> Dict[str, Any]:
-        """Get current session state."""
-        return self.session_state.copy()
+            return _OPERATION_ERROR_TEXT_TEMPLATE.format(
+                operation=operation,
+                error=error_msg,
+                payload=safe_json_dumps(error_response, indent=2)
+            )
     
+    def get_session_state(self) -> Mapping[str, Any]:
+        """
+        Get a read-only view of the current session state.
+
+        Zero-copy: the proxy shares the live state without the per-call
+        dict copy, and callers can't mutate the top level. As with
+        FROZEN_CONFIG, the nested lists and dicts are only guarded by
+        convention.
+        """
+        return MappingProxyType(self.session_state)
+
     def set_session_state(self, state: Dict[str, Any]):
         """Set session state (for loading saved sessions)."""
-        self.session_state = state
\ No newline at end of file
+        if not isinstance(state, dict):
+            # Accept a view from get_session_state without freezing the
+            # live session behind a read-only proxy
+            state = dict(state)
+        self.session_state = state
+        self._completed_ids = {c['task_id'] for c in state.get('completed', [])}
+        self._task_index = {t['id']: t for t in state.get('tasks', []) if 'id' in t}
+        # Later entries win, matching the old reversed() scan
+        self._schedule_by_date = {
+            entry['date']: entry['schedule']
+            for entry in state.get('schedules', [])
+            if 'date' in entry
+        }
+        self._session_version += 1
\ No newline at end of file
@@ -3,17 +3,18 @@ Unit tests for SchedulePlanner agent.
 """
 
 import unittest
-import json
 from datetime import datetime, date
 from agents.schedule_planner import SchedulePlanner
+from utils.json_utils import safe_json_loads
 
 class TestSchedulePlanner(unittest.TestCase):
     """Test cases for SchedulePlanner agent."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.planner = SchedulePlanner()
-        self.sample_tasks = [
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared fixtures once; the planner is stateless across calls."""
+        cls.planner = SchedulePlanner()
+        cls.sample_tasks = [
             {
                 "title": "Review project proposal",
                 "duration_minutes": 60,
@@ -32,7 +33,7 @@ class TestSchedulePlanner(unittest.TestCase):
                 "priority": "low"
             }
         ]
-        self.sample_preferences = {
+        cls.sample_preferences = {
             "work_hours": {"start": "09:00", "end": "17:00"},
             "preferred_focus_minutes": 90
         }
@@ -47,8 +48,8 @@ class TestSchedulePlanner(unittest.TestCase):
             timezone="UTC"
         )
         
-        schedule_data = json.loads(result)
-        
+        schedule_data = safe_json_loads(result)
+
         # Verify schedule structure
         self.assertIn('date', schedule_data)
         self.assertIn('blocks', schedule_data)
@@ -65,9 +66,9 @@ class TestSchedulePlanner(unittest.TestCase):
             timezone="UTC"
         )
         
-        schedule_data = json.loads(result)
+        schedule_data = safe_json_loads(result)
         blocks = schedule_data.get('blocks', [])
-        
+
         # Should have at least one block
         self.assertGreater(len(blocks), 0)
         
@@ -93,17 +94,17 @@ class TestSchedulePlanner(unittest.TestCase):
             timezone="UTC"
         )
         
-        schedule_data = json.loads(result)
+        schedule_data = safe_json_loads(result)
         blocks = schedule_data.get('blocks', [])
-        
+
         # No block should overlap with blocked time
+        blocked_start = datetime.fromisoformat("2025-11-27T12:00:00")
+        blocked_end = datetime.fromisoformat("2025-11-27T13:00:00")
+
         for block in blocks:
             start_time = datetime.fromisoformat(block['start'])
             end_time = datetime.fromisoformat(block['end'])
-            
-            blocked_start = datetime.fromisoformat("2025-11-27T12:00:00")
-            blocked_end = datetime.fromisoformat("2025-11-27T13:00:00")
-            
+
             # Check no overlap
             self.assertTrue(
                 end_time <= blocked_start or start_time >= blocked_end,
@@ -126,9 +127,9 @@ class TestSchedulePlanner(unittest.TestCase):
             timezone="UTC"
         )
         
-        schedule_data = json.loads(result)
+        schedule_data = safe_json_loads(result)
         blocks = schedule_data.get('blocks', [])
-        
+
         # Should be split into multiple blocks
         coding_blocks = [b for b in blocks if "Long coding session" in b['task_title']]
         self.assertGreater(len(coding_blocks), 1)
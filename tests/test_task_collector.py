@@ -3,22 +3,23 @@ Unit tests for TaskCollector agent.
 """
 
 import unittest
-import json
 from agents.task_collector import TaskCollector
+from utils.json_utils import safe_json_loads
 
 class TestTaskCollector(unittest.TestCase):
     """Test cases for TaskCollector agent."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.collector = TaskCollector()
+    @classmethod
+    def setUpClass(cls):
+        """Set up a shared collector; it holds no per-call state."""
+        cls.collector = TaskCollector()
     
     def test_single_task_extraction(self):
         """Test extracting a single task."""
         user_input = "I need to call the dentist by Friday"
         result = self.collector.process_user_input(user_input)
-        task_data = json.loads(result)
-        
+        task_data = safe_json_loads(result)
+
         self.assertEqual(task_data['title'], "I need to call the dentist by Friday")
         self.assertIn('communication', task_data.get('tags', []))
         self.assertIsNotNone(task_data.get('due_date'))
@@ -27,8 +28,8 @@ class TestTaskCollector(unittest.TestCase):
         """Test extracting multiple tasks."""
         user_input = "1. Buy groceries 2. Call mom 3. Finish project report"
         result = self.collector.process_user_input(user_input)
-        task_data = json.loads(result)
-        
+        task_data = safe_json_loads(result)
+
         self.assertIsInstance(task_data, list)
         self.assertEqual(len(task_data), 3)
         self.assertEqual(task_data[0]['title'], "Buy groceries")
@@ -39,12 +40,12 @@ class TestTaskCollector(unittest.TestCase):
         """Test priority extraction from text."""
         # High priority
         urgent_input = "URGENT: Fix the server issue"
-        result = json.loads(self.collector.process_user_input(urgent_input))
+        result = safe_json_loads(self.collector.process_user_input(urgent_input))
         self.assertEqual(result['priority'], 'high')
         
         # Low priority
         someday_input = "Someday I should organize my bookshelf"
-        result = json.loads(self.collector.process_user_input(someday_input))
+        result = safe_json_loads(self.collector.process_user_input(someday_input))
         self.assertEqual(result['priority'], 'low')
     
     def test_duration_extraction(self):
@@ -58,13 +59,13 @@ class TestTaskCollector(unittest.TestCase):
         ]
         
         for input_text, expected_duration in test_cases:
-            result = json.loads(self.collector.process_user_input(input_text))
+            result = safe_json_loads(self.collector.process_user_input(input_text))
             self.assertEqual(result.get('duration_minutes'), expected_duration)
     
     def test_tag_extraction(self):
         """Test tag extraction from text."""
         work_input = "Prepare quarterly project meeting with client"
-        result = json.loads(self.collector.process_user_input(work_input))
+        result = safe_json_loads(self.collector.process_user_input(work_input))
         tags = result.get('tags', [])
         
         self.assertIn('work', tags)
@@ -74,11 +75,11 @@ class TestTaskCollector(unittest.TestCase):
     def test_recurring_pattern_extraction(self):
         """Test recurring pattern extraction."""
         daily_input = "Daily standup meeting every morning"
-        result = json.loads(self.collector.process_user_input(daily_input))
+        result = safe_json_loads(self.collector.process_user_input(daily_input))
         self.assertEqual(result.get('recurring'), 'daily')
         
         weekly_input = "Weekly team review meeting"
-        result = json.loads(self.collector.process_user_input(weekly_input))
+        result = safe_json_loads(self.collector.process_user_input(weekly_input))
         self.assertEqual(result.get('recurring'), 'weekly')
 
 if __name__ == '__main__':
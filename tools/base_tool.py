@@ -3,8 +3,12 @@ Base Tool class for Agent Development Kit integration.
 Provides standardized interface for all agent tools.
 """
 
+import json
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, List, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -15,7 +19,13 @@ class ToolInput(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Tool-specific parameters")
 
 class ToolOutput(BaseModel):
-    """Base output schema for all tools."""
+    """
+    Base output schema for all tools.
+
+    Outputs are built from trusted in-process values, so tools construct
+    them with ToolOutput.construct() to skip per-field validation on the
+    hot path; only ToolInput, which may carry caller data, is validated.
+    """
     result: Any = Field(..., description="Tool execution result")
     success: bool = Field(True, description="Whether tool executed successfully")
     error_message: Optional[str] = Field(None, description="Error message if failed")
@@ -27,29 +37,84 @@ class ToolOutput(BaseModel):
             datetime: lambda v: v.isoformat()
         }
 
+@lru_cache(maxsize=1)
+def _io_schemas() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Build the (input, output) JSON schemas once.
+
+    pydantic's .schema() walks the model on every call but the result is
+    invariant, and every tool shares the same ToolInput/ToolOutput pair.
+    """
+    return ToolInput.schema(), ToolOutput.schema()
+
 class BaseTool(ABC):
     """
     Abstract base class for all ADK tools.
     Provides standardized interface for agent tool integration.
     """
     
-    def __init__(self, name: str, description: str):
+    # Result-cache bounds shared by all cacheable tools
+    CACHE_TTL_SECONDS = 300
+    CACHE_MAX_ENTRIES = 512
+    
+    def __init__(self, name: str, description: str, cacheable: bool = False):
         """
         Initialize base tool.
         
         Args:
             name: Tool name identifier
             description: Human-readable tool description
+            cacheable: Whether identical calls may return cached results.
+                Only safe for read-only tools without side effects.
         """
         self.name = name
         self.description = description
+        self.cacheable = cacheable
         self.usage_count = 0
+        self.cache_hits = 0
         self.last_used = None
+        self._result_cache: "OrderedDict[Tuple[str, str], Tuple[float, ToolOutput]]" = OrderedDict()
     
-    @abstractmethod
     def execute(self, input_data: ToolInput) -> ToolOutput:
         """
-        Execute the tool with given input.
+        Execute the tool, serving repeated identical calls from a TTL cache.
+        
+        Caching only applies to tools constructed with cacheable=True and
+        only to successful results, so read-only network tools skip repeat
+        HTTP round trips while side-effectful tools always run.
+        
+        Args:
+            input_data: Tool input data
+            
+        Returns:
+            Tool execution result
+        """
+        if not self.cacheable:
+            return self._execute(input_data)
+        
+        key = (input_data.query, json.dumps(input_data.parameters or {}, sort_keys=True))
+        now = time.monotonic()
+        
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            cached_at, output = cached
+            if now - cached_at < self.CACHE_TTL_SECONDS:
+                self._result_cache.move_to_end(key)
+                self.cache_hits += 1
+                return output
+            del self._result_cache[key]
+        
+        output = self._execute(input_data)
+        if output.success:
+            self._result_cache[key] = (now, output)
+            if len(self._result_cache) > self.CACHE_MAX_ENTRIES:
+                self._result_cache.popitem(last=False)
+        return output
+    
+    @abstractmethod
+    def _execute(self, input_data: ToolInput) -> ToolOutput:
+        """
+        Run the tool with given input (implemented by subclasses).
         
         Args:
             input_data: Tool input data
@@ -59,13 +124,33 @@ class BaseTool(ABC):
         """
         pass
     
+    def cache_clear(self):
+        """Drop all cached results for this tool."""
+        self._result_cache.clear()
+    
+    def execute_batch(self, inputs: List[ToolInput]) -> List[ToolOutput]:
+        """
+        Execute several inputs in one call.
+
+        Subclasses may override this to batch the underlying API request;
+        the default implementation executes inputs sequentially.
+
+        Args:
+            inputs: List of tool input data
+
+        Returns:
+            List of execution results in input order
+        """
+        return [self.execute(input_data) for input_data in inputs]
+
     def get_schema(self) -> Dict[str, Any]:
         """Get tool schema for agent integration."""
+        input_schema, output_schema = _io_schemas()
         return {
             "name": self.name,
             "description": self.description,
-            "input_schema": ToolInput.schema(),
-            "output_schema": ToolOutput.schema()
+            "input_schema": input_schema,
+            "output_schema": output_schema
         }
     
     def _log_usage(self):
@@ -78,5 +163,6 @@ class BaseTool(ABC):
         return {
             "name": self.name,
             "usage_count": self.usage_count,
+            "cache_hits": self.cache_hits,
             "last_used": self.last_used.isoformat() if self.last_used else None
         }
\ No newline at end of file
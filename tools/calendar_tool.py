@@ -3,10 +3,15 @@ Calendar Tool for Agent Development Kit.
 Provides calendar integration capabilities for scheduling agents.
 """
 
-from datetime import datetime, timedelta, date
+from bisect import bisect_left
+from datetime import datetime, timedelta, date, time
 from typing import Dict, Any, List, Optional
 from tools.base_tool import BaseTool, ToolInput, ToolOutput
 
+# Default availability window, built once instead of per call
+_DEFAULT_WORK_START = time(hour=9)
+_DEFAULT_WORK_END = time(hour=17)
+
 class CalendarTool(BaseTool):
     """
     Calendar management tool for scheduling operations.
@@ -19,8 +24,17 @@ class CalendarTool(BaseTool):
             description="Manage calendar events, check availability, and schedule conflicts"
         )
         self.events = []  # In-memory storage for demo
+        # Parsed (start, end) datetimes aligned with self.events, filled at
+        # insert time so conflict checks never re-parse ISO strings
+        self._event_spans = []
+        # Interval index sorted by start: parallel lists of start datetimes,
+        # (start, end, event index) triples, and a running prefix-max of end
+        # times so overlap queries can stop their backward walk early
+        self._sorted_starts: List[datetime] = []
+        self._sorted_spans: List[tuple] = []
+        self._max_end_prefix: List[datetime] = []
     
-    def execute(self, input_data: ToolInput) -> ToolOutput:
+    def _execute(self, input_data: ToolInput) -> ToolOutput:
         """
         Execute calendar operation based on query.
         
@@ -44,14 +58,14 @@ class CalendarTool(BaseTool):
             elif 'list events' in query:
                 return self._list_events(input_data)
             else:
-                return ToolOutput(
+                return ToolOutput.construct(
                     result=[],
                     success=False,
                     error_message=f"Unknown calendar operation: {query}",
                     metadata={'operation': query}
                 )
         except Exception as e:
-            return ToolOutput(
+            return ToolOutput.construct(
                 result=[],
                 success=False,
                 error_message=f"Calendar operation failed: {str(e)}",
@@ -67,20 +81,14 @@ class CalendarTool(BaseTool):
         if not start_time or not end_time:
             # Default to checking today's availability
             today = date.today()
-            start_time = datetime.combine(today, datetime.min.time().replace(hour=9))
-            end_time = datetime.combine(today, datetime.min.time().replace(hour=17))
+            start_time = datetime.combine(today, _DEFAULT_WORK_START)
+            end_time = datetime.combine(today, _DEFAULT_WORK_END)
         else:
             start_time = datetime.fromisoformat(start_time)
             end_time = datetime.fromisoformat(end_time)
         
-        # Check for conflicts
-        conflicts = []
-        for event in self.events:
-            event_start = datetime.fromisoformat(event['start'])
-            event_end = datetime.fromisoformat(event['end'])
-            
-            if (start_time < event_end and end_time > event_start):
-                conflicts.append(event)
+        # Check for conflicts via the sorted interval index
+        conflicts = self._overlapping_events(start_time, end_time)
         
         # Find available time slots
         available_slots = []
@@ -91,7 +99,7 @@ class CalendarTool(BaseTool):
                 'duration_minutes': int((end_time - start_time).total_seconds() / 60)
             })
         
-        return ToolOutput(
+        return ToolOutput.construct(
             result={
                 'available_slots': available_slots,
                 'conflicts': conflicts,
@@ -114,13 +122,18 @@ class CalendarTool(BaseTool):
         required_fields = ['title', 'start', 'end']
         for field in required_fields:
             if field not in event_data:
-                return ToolOutput(
+                return ToolOutput.construct(
                     result=None,
                     success=False,
                     error_message=f"Missing required field: {field}",
                     metadata={'missing_field': field}
                 )
         
+        # Parse once at insert time; bad timestamps fail here instead of on
+        # every later availability check
+        start_dt = datetime.fromisoformat(event_data['start'])
+        end_dt = datetime.fromisoformat(event_data['end'])
+
         event = {
             'id': f"event_{len(self.events) + 1}",
             'title': event_data['title'],
@@ -129,16 +142,54 @@ class CalendarTool(BaseTool):
             'description': event_data.get('description', ''),
             'created_at': datetime.now().isoformat()
         }
-        
+
         self.events.append(event)
+        self._event_spans.append((start_dt, end_dt))
+        self._index_event(start_dt, end_dt, len(self.events) - 1)
         
-        return ToolOutput(
+        return ToolOutput.construct(
             result=event,
             success=True,
             error_message=None,
             metadata={'total_events': len(self.events)}
         )
     
+    def _index_event(self, start_dt: datetime, end_dt: datetime, event_idx: int):
+        """Insert an event's span into the sorted interval index."""
+        position = bisect_left(self._sorted_starts, start_dt)
+        self._sorted_starts.insert(position, start_dt)
+        self._sorted_spans.insert(position, (start_dt, end_dt, event_idx))
+
+        # Rebuild the prefix-max tail from the insertion point; events are
+        # usually added in chronological order, so this is O(1) amortized
+        del self._max_end_prefix[position:]
+        running_max = self._max_end_prefix[-1] if self._max_end_prefix else end_dt
+        for _, span_end, _ in self._sorted_spans[position:]:
+            running_max = max(running_max, span_end)
+            self._max_end_prefix.append(running_max)
+
+    def _overlapping_events(self, start_time: datetime, end_time: datetime) -> List[Dict[str, Any]]:
+        """
+        Return events overlapping [start_time, end_time), earliest first.
+
+        Candidates are the indexed spans starting before end_time; the
+        backward walk stops as soon as the prefix-max of end times falls at
+        or before start_time, so lookups touch O(log N + overlaps) entries
+        instead of scanning every stored event.
+        """
+        hi = bisect_left(self._sorted_starts, end_time)
+
+        overlapping = []
+        for i in range(hi - 1, -1, -1):
+            if self._max_end_prefix[i] <= start_time:
+                break
+            span_start, span_end, event_idx = self._sorted_spans[i]
+            if span_end > start_time:
+                overlapping.append(self.events[event_idx])
+
+        overlapping.reverse()
+        return overlapping
+
     def _check_conflicts(self, input_data: ToolInput) -> ToolOutput:
         """Check for scheduling conflicts."""
         parameters = input_data.parameters or {}
@@ -146,7 +197,7 @@ class CalendarTool(BaseTool):
         proposed_end = parameters.get('end')
         
         if not proposed_start or not proposed_end:
-            return ToolOutput(
+            return ToolOutput.construct(
                 result=[],
                 success=False,
                 error_message="Start and end times required for conflict checking",
@@ -156,15 +207,9 @@ class CalendarTool(BaseTool):
         proposed_start = datetime.fromisoformat(proposed_start)
         proposed_end = datetime.fromisoformat(proposed_end)
         
-        conflicts = []
-        for event in self.events:
-            event_start = datetime.fromisoformat(event['start'])
-            event_end = datetime.fromisoformat(event['end'])
-            
-            if (proposed_start < event_end and proposed_end > event_start):
-                conflicts.append(event)
+        conflicts = self._overlapping_events(proposed_start, proposed_end)
         
-        return ToolOutput(
+        return ToolOutput.construct(
             result=conflicts,
             success=True,
             error_message=None,
@@ -183,20 +228,19 @@ class CalendarTool(BaseTool):
             # Filter events by date
             target_date = datetime.fromisoformat(date_filter).date()
             filtered_events = []
-            
-            for event in self.events:
-                event_date = datetime.fromisoformat(event['start']).date()
-                if event_date == target_date:
+
+            for event, (event_start, _) in zip(self.events, self._event_spans):
+                if event_start.date() == target_date:
                     filtered_events.append(event)
             
-            return ToolOutput(
+            return ToolOutput.construct(
                 result=filtered_events,
                 success=True,
                 error_message=None,
                 metadata={'filtered_date': date_filter}
             )
         else:
-            return ToolOutput(
+            return ToolOutput.construct(
                 result=self.events,
                 success=True,
                 error_message=None,
@@ -215,8 +259,11 @@ class CalendarTool(BaseTool):
         Returns:
             Block creation result
         """
-        input_data = ToolInput(
+        # Built from trusted in-process values; construct() skips the
+        # per-field validation a plain ToolInput() would run
+        input_data = ToolInput.construct(
             query="add event",
+            context={},
             parameters={
                 'title': f"BLOCKED: {reason}",
                 'start': start,
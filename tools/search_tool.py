@@ -4,9 +4,23 @@ Provides Google Custom Search integration for knowledge agents.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, List, Optional
 from tools.base_tool import BaseTool, ToolInput, ToolOutput
 
+def _build_session() -> requests.Session:
+    """Build a session with a keep-alive pool for the search API host."""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+# Shared across SearchTool instances so repeat searches reuse the same
+# TCP+TLS connections instead of handshaking per request
+_DEFAULT_SESSION = _build_session()
+
+# (connect, read) timeouts so a stalled search cannot hang an agent turn
+_REQUEST_TIMEOUT = (3, 10)
+
 class SearchTool(BaseTool):
     """
     Google Custom Search tool for agent knowledge retrieval.
@@ -22,13 +36,15 @@ class SearchTool(BaseTool):
         """
         super().__init__(
             name="google_search",
-            description="Search Google for information and return structured results"
+            description="Search Google for information and return structured results",
+            cacheable=True
         )
         self.api_key = api_key
         self.search_engine_id = search_engine_id or "017576662512468239146:omuauf_lfve"
         self.base_url = "https://www.googleapis.com/customsearch/v1"
+        self._session = _DEFAULT_SESSION
     
-    def execute(self, input_data: ToolInput) -> ToolOutput:
+    def _execute(self, input_data: ToolInput) -> ToolOutput:
         """
         Execute Google search query.
         
@@ -53,8 +69,10 @@ class SearchTool(BaseTool):
                 'num': min(num_results, 10)  # Google API limit
             }
             
-            # Execute search request
-            response = requests.get(self.base_url, params=params)
+            # Execute search request over the pooled session
+            response = self._session.get(
+                self.base_url, params=params, timeout=_REQUEST_TIMEOUT
+            )
             response.raise_for_status()
             
             data = response.json()
@@ -69,7 +87,7 @@ class SearchTool(BaseTool):
                     'displayLink': item.get('displayLink', '')
                 })
             
-            return ToolOutput(
+            return ToolOutput.construct(
                 result=results,
                 success=True,
                 error_message=None,
@@ -81,14 +99,14 @@ class SearchTool(BaseTool):
             )
             
         except requests.RequestException as e:
-            return ToolOutput(
+            return ToolOutput.construct(
                 result=[],
                 success=False,
                 error_message=f"Search request failed: {str(e)}",
                 metadata={'query': input_data.query}
             )
         except Exception as e:
-            return ToolOutput(
+            return ToolOutput.construct(
                 result=[],
                 success=False,
                 error_message=f"Search execution failed: {str(e)}",
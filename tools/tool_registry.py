@@ -3,11 +3,17 @@ Tool Registry for Agent Development Kit.
 Manages and coordinates all available tools for multi-agent system.
 """
 
+import asyncio
+import re
 from typing import Dict, Any, List, Optional, Type
 from tools.base_tool import BaseTool, ToolInput, ToolOutput
-from tools.search_tool import SearchTool
 from tools.calendar_tool import CalendarTool
-from tools.weather_tool import WeatherTool
+
+# Query keywords per tool category, in the order categories are suggested
+_CATEGORY_KEYWORDS = (
+    ('knowledge', ('search', 'find', 'research', 'information', 'weather')),
+    ('scheduling', ('schedule', 'calendar', 'meeting', 'appointment', 'time')),
+)
 
 class ToolRegistry:
     """
@@ -18,12 +24,26 @@ class ToolRegistry:
     def __init__(self):
         """Initialize tool registry."""
         self.tools: Dict[str, BaseTool] = {}
+        # Cached list_tools() / get_tool_schemas() output, rebuilt lazily
+        # after registrations
+        self._cached_names: Optional[List[str]] = None
+        self._schema_cache: Optional[Dict[str, Dict[str, Any]]] = None
         self.tool_categories: Dict[str, List[str]] = {
             'knowledge': [],
             'scheduling': [],
             'communication': [],
             'utility': []
         }
+        # One compiled scan over the query replaces per-keyword substring
+        # loops in find_tools_for_query; longest-first keeps matches greedy
+        self._kw_to_cat: Dict[str, str] = {
+            keyword: category
+            for category, keywords in _CATEGORY_KEYWORDS
+            for keyword in keywords
+        }
+        self._kw_re = re.compile('|'.join(
+            sorted(map(re.escape, self._kw_to_cat), key=len, reverse=True)
+        ))
     
     def register_tool(self, tool: BaseTool, category: str = 'utility') -> bool:
         """
@@ -43,6 +63,8 @@ class ToolRegistry:
                 self.tool_categories[category] = []
             
             self.tool_categories[category].append(tool.name)
+            self._cached_names = None
+            self._schema_cache = None
             return True
         except Exception:
             return False
@@ -63,8 +85,9 @@ class ToolRegistry:
         """
         if category:
             return self.tool_categories.get(category, [])
-        else:
-            return list(self.tools.keys())
+        if self._cached_names is None:
+            self._cached_names = list(self.tools.keys())
+        return self._cached_names
     
     def execute_tool(self, tool_name: str, input_data: ToolInput) -> ToolOutput:
         """
@@ -79,7 +102,7 @@ class ToolRegistry:
         """
         tool = self.get_tool(tool_name)
         if not tool:
-            return ToolOutput(
+            return ToolOutput.construct(
                 result=None,
                 success=False,
                 error_message=f"Tool '{tool_name}' not found"
@@ -88,11 +111,19 @@ class ToolRegistry:
         return tool.execute(input_data)
     
     def get_tool_schemas(self) -> Dict[str, Dict[str, Any]]:
-        """Get schemas for all registered tools."""
-        schemas = {}
-        for tool_name, tool in self.tools.items():
-            schemas[tool_name] = tool.get_schema()
-        return schemas
+        """
+        Get schemas for all registered tools.
+
+        Schemas only change when a tool is registered, so the aggregate is
+        cached and invalidated by register_tool. Usage statistics stay
+        uncached: they change on every execution.
+        """
+        if self._schema_cache is None:
+            self._schema_cache = {
+                tool_name: tool.get_schema()
+                for tool_name, tool in self.tools.items()
+            }
+        return self._schema_cache
     
     def get_usage_statistics(self) -> Dict[str, Any]:
         """Get usage statistics for all tools."""
@@ -108,6 +139,12 @@ class ToolRegistry:
         Args:
             config: Configuration dictionary with API keys and settings
         """
+        # Imported here rather than at module load: both tools pull in
+        # requests (urllib3 + ssl), which callers that never initialize
+        # network tools - notably the unit tests - should not pay for
+        from tools.search_tool import SearchTool
+        from tools.weather_tool import WeatherTool
+
         api_keys = config.get('api_keys', {})
         
         # Initialize Search Tool
@@ -135,20 +172,23 @@ class ToolRegistry:
         Returns:
             List of relevant tool names
         """
-        query_lower = query.lower()
+        matched_categories = {
+            self._kw_to_cat[match] for match in self._kw_re.findall(query.lower())
+        }
+
         relevant_tools = []
-        
-        # Knowledge-related keywords
-        if any(word in query_lower for word in ['search', 'find', 'research', 'information', 'weather']):
-            relevant_tools.extend(self.tool_categories.get('knowledge', []))
-        
-        # Scheduling-related keywords
-        if any(word in query_lower for word in ['schedule', 'calendar', 'meeting', 'appointment', 'time']):
-            relevant_tools.extend(self.tool_categories.get('scheduling', []))
-        
+        for category, _ in _CATEGORY_KEYWORDS:
+            if category in matched_categories:
+                relevant_tools.extend(self.tool_categories.get(category, []))
+
         # Remove duplicates while preserving order
         return list(dict.fromkeys(relevant_tools))
     
+    def cache_clear(self) -> None:
+        """Drop cached results on every registered tool."""
+        for tool in self.tools.values():
+            tool.cache_clear()
+
     def batch_execute(self, operations: List[Dict[str, Any]]) -> List[ToolOutput]:
         """
         Execute multiple tool operations in batch.
@@ -166,7 +206,7 @@ class ToolRegistry:
             input_data = ToolInput(**operation.get('input_data', {}))
             
             if not tool_name:
-                results.append(ToolOutput(
+                results.append(ToolOutput.construct(
                     result=None,
                     success=False,
                     error_message="Tool name is required",
@@ -176,7 +216,55 @@ class ToolRegistry:
             
             result = self.execute_tool(tool_name, input_data)
             results.append(result)
-        
+
+        return results
+
+    async def batch_execute_async(self, operations: List[Dict[str, Any]]) -> List[ToolOutput]:
+        """
+        Execute multiple tool operations concurrently.
+
+        Network-bound tools dominate batch latency, so operations run in
+        worker threads and are gathered together: wall time approaches the
+        slowest call instead of the sum. Results keep the input order and
+        match batch_execute's error contract.
+
+        Args:
+            operations: List of operations with tool_name and input_data
+
+        Returns:
+            List of execution results
+        """
+        async def run_one(operation: Dict[str, Any]) -> ToolOutput:
+            tool_name = operation.get('tool_name')
+
+            if not tool_name:
+                return ToolOutput.construct(
+                    result=None,
+                    success=False,
+                    error_message="Tool name is required",
+                    metadata={'operation': operation}
+                )
+
+            input_data = ToolInput(**operation.get('input_data', {}))
+            return await asyncio.to_thread(self.execute_tool, tool_name, input_data)
+
+        gathered = await asyncio.gather(
+            *(run_one(operation) for operation in operations),
+            return_exceptions=True
+        )
+
+        results = []
+        for operation, outcome in zip(operations, gathered):
+            if isinstance(outcome, BaseException):
+                results.append(ToolOutput.construct(
+                    result=None,
+                    success=False,
+                    error_message=f"Batch execution failed: {str(outcome)}",
+                    metadata={'operation': operation, 'exception_type': type(outcome).__name__}
+                ))
+            else:
+                results.append(outcome)
+
         return results
 
 
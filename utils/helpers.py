@@ -2,13 +2,100 @@
 Utility functions for the Smart Daily Productivity Assistant.
 """
 
-import json
+import copy
+import io
+import mmap
 import pickle
 import os
+import re
+import sys
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+from utils.json_utils import safe_json_dumps, safe_json_loads
+
+# Matches every character that is not allowed in a task-id slug
+_SLUG_DISALLOWED_RE = re.compile(r'[^a-z0-9-]')
+
+# Weekday scan table: one compiled pass replaces a per-name substring loop
+_WEEKDAY_IDX = {
+    name: index
+    for index, name in enumerate(
+        ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+    )
+}
+_WEEKDAY_RE = re.compile('|'.join(_WEEKDAY_IDX))
+
+# Sessions above this size are parsed straight out of the page cache
+# via mmap instead of copying the bytes into the process first
+_MMAP_THRESHOLD = 64 * 1024
+
+@lru_cache(maxsize=16)
+def _parse_hhmm(value: str):
+    """
+    Parse an HH:MM string to a time object, cached per distinct string.
+
+    Work-hour strings almost never change between calls and strptime is
+    costly, so repeat parses become a dict lookup.
+    """
+    return datetime.strptime(value, "%H:%M").time()
+
+@lru_cache(maxsize=256)
+def _parse_iso(value: str) -> Optional[datetime]:
+    """
+    Parse an ISO-8601 timestamp, tolerating a trailing 'Z' suffix.
+
+    Returns None for unparseable strings so validators can report a
+    format error without wrapping every call in try/except. Cached so
+    batches that repeat the same due dates skip re-parsing.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    if value.endswith('Z'):
+        try:
+            return datetime.fromisoformat(value[:-1] + '+00:00')
+        except ValueError:
+            pass
+    return None
+
+def slugify(title: str, max_length: int = 20) -> str:
+    """
+    Turn a title into a lowercase dash-separated slug.
+
+    Args:
+        title: Text to slugify
+        max_length: Maximum slug length
+
+    Returns:
+        Slug containing only lowercase letters, digits and dashes
+    """
+    slug = title.lower().replace(' ', '-').replace('_', '-')
+    return _SLUG_DISALLOWED_RE.sub('', slug)[:max_length]
+
+@contextmanager
+def buffered_output():
+    """
+    Collect prints made inside the block and emit them in a single write.
+
+    A demo section makes dozens of small print() calls, each its own
+    write syscall when output is piped to a file or CI log; buffering
+    them collapses a section into one write.
+    """
+    buffer = io.StringIO()
+    previous = sys.stdout
+    sys.stdout = buffer
+    try:
+        yield
+    finally:
+        sys.stdout = previous
+        previous.write(buffer.getvalue())
+        previous.flush()
+
 class SessionManager:
     """Manages session persistence and state."""
     
@@ -21,20 +108,40 @@ class SessionManager:
         """
         self.session_dir = Path(session_dir)
         self.session_dir.mkdir(exist_ok=True)
+        # Parsed sessions keyed by id, validated against the file's mtime
+        # so unchanged files skip the read-and-parse on repeat loads
+        self._cache: Dict[str, Any] = {}
     
-    def save_session(self, session_state: Dict[str, Any], session_id: str = "default") -> bool:
+    def save_session(
+        self,
+        session_state: Dict[str, Any],
+        session_id: str = "default",
+        pretty: bool = False
+    ) -> bool:
         """
         Save session state to file.
-        
+
         Args:
             session_state: Current session state
             session_id: Unique identifier for the session
-            
+            pretty: Indent the file for human inspection (compact by default)
+
         Returns:
             True if saved successfully
         """
         try:
             session_file = self.session_dir / f"{session_id}.json"
+
+            # Accept read-only session views from the orchestrator
+            if not isinstance(session_state, dict):
+                session_state = dict(session_state)
+
+            # Skip the write when the state matches what is already on disk
+            cached = self._cache.get(session_id)
+            if (cached is not None and session_file.exists()
+                    and session_file.stat().st_mtime_ns == cached[0]
+                    and cached[1] == session_state):
+                return True
             
             # Add metadata
             session_with_meta = {
@@ -43,9 +150,18 @@ class SessionManager:
                 "version": "1.0"
             }
             
-            with open(session_file, 'w') as f:
-                json.dump(session_with_meta, f, indent=2)
-            
+            # Write the whole payload to a sibling tmp file and rename it
+            # into place: one contiguous write, and readers (or a crash
+            # mid-save) never observe a half-written session
+            tmp_file = session_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w') as f:
+                # safe_json_dumps encodes the datetimes live schedules carry
+                f.write(safe_json_dumps(session_with_meta, indent=2 if pretty else None))
+            os.replace(tmp_file, session_file)
+
+            self._cache[session_id] = (
+                session_file.stat().st_mtime_ns, copy.deepcopy(session_state)
+            )
             return True
         except Exception as e:
             print(f"Failed to save session: {e}")
@@ -67,32 +183,56 @@ class SessionManager:
             if not session_file.exists():
                 return None
             
-            with open(session_file, 'r') as f:
-                session_with_meta = json.load(f)
+            # Serve an unchanged file from the cache; copies keep callers
+            # from mutating the cached state behind our back
+            mtime = session_file.stat().st_mtime_ns
+            cached = self._cache.get(session_id)
+            if cached is not None and cached[0] == mtime:
+                return copy.deepcopy(cached[1])
             
-            return session_with_meta.get("session_data")
+            with open(session_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        session_with_meta = safe_json_loads(memoryview(mapped))
+                    finally:
+                        mapped.close()
+                else:
+                    session_with_meta = safe_json_loads(f.read())
+            
+            session_data = session_with_meta.get("session_data")
+            self._cache[session_id] = (mtime, copy.deepcopy(session_data))
+            return session_data
         except Exception as e:
             print(f"Failed to load session: {e}")
             return None
     
     def list_sessions(self) -> List[str]:
         """List all available session IDs."""
-        session_files = self.session_dir.glob("*.json")
-        return [f.stem for f in session_files]
+        # scandir reads the ids straight from directory entries without
+        # building a Path (or paying an extra stat) per session file
+        with os.scandir(self.session_dir) as entries:
+            return [
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            ]
     
     def cleanup_old_sessions(self, days: int = 30):
-        """Remove session files older than specified days."""
-        cutoff_date = datetime.now() - timedelta(days=days)
-        
+        """
+        Remove session files older than specified days.
+
+        The file mtime stands in for the saved_at field - save_session
+        rewrites the whole file on every save, so the two agree - which
+        turns a read-and-parse of every session into one stat() per file.
+        """
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+
         for session_file in self.session_dir.glob("*.json"):
             try:
-                with open(session_file, 'r') as f:
-                    session_data = json.load(f)
-                
-                saved_at = datetime.fromisoformat(session_data.get("saved_at", ""))
-                if saved_at < cutoff_date:
-                    session_file.unlink()
-            except Exception:
+                if session_file.stat().st_mtime < cutoff:
+                    session_file.unlink(missing_ok=True)
+            except OSError:
                 continue
 
 class TimeUtils:
@@ -119,24 +259,22 @@ class TimeUtils:
         elif date_str_lower in ['yesterday']:
             return (now - timedelta(days=1)).replace(hour=9, minute=0, second=0, microsecond=0)
         
-        # Weekdays
-        weekdays = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6
-        }
-        
-        for day_name, day_num in weekdays.items():
-            if day_name in date_str_lower:
-                days_ahead = day_num - now.weekday()
-                if days_ahead <= 0:  # Target day already happened this week
-                    days_ahead += 7
-                
-                if 'next' in date_str_lower:
-                    days_ahead += 7
-                
-                target_date = now + timedelta(days=days_ahead)
-                return target_date.replace(hour=9, minute=0, second=0, microsecond=0)
-        
+        # Weekdays: one scan, resolved in Monday-first order to keep the
+        # old dict-iteration precedence for strings naming several days
+        matched = set(_WEEKDAY_RE.findall(date_str_lower))
+        if matched:
+            for day_name, day_num in _WEEKDAY_IDX.items():
+                if day_name in matched:
+                    days_ahead = day_num - now.weekday()
+                    if days_ahead <= 0:  # Target day already happened this week
+                        days_ahead += 7
+
+                    if 'next' in date_str_lower:
+                        days_ahead += 7
+
+                    target_date = now + timedelta(days=days_ahead)
+                    return target_date.replace(hour=9, minute=0, second=0, microsecond=0)
+
         return None
     
     @staticmethod
@@ -178,10 +316,7 @@ class TimeUtils:
         Returns:
             True if within work hours
         """
-        work_start_time = datetime.strptime(work_start, "%H:%M").time()
-        work_end_time = datetime.strptime(work_end, "%H:%M").time()
-        
-        return work_start_time <= dt.time() <= work_end_time
+        return _parse_hhmm(work_start) <= dt.time() <= _parse_hhmm(work_end)
 
 class ValidationUtils:
     """Utility functions for data validation."""
@@ -215,11 +350,8 @@ class ValidationUtils:
         
         # Due date validation
         due_date = task.get('due_date')
-        if due_date is not None:
-            try:
-                datetime.fromisoformat(due_date.replace('Z', '+00:00'))
-            except ValueError:
-                errors.append("Invalid due date format")
+        if due_date is not None and _parse_iso(due_date) is None:
+            errors.append("Invalid due date format")
         
         return errors
     
@@ -271,14 +403,12 @@ class ValidationUtils:
                 errors.append(f"Missing required field: {field}")
         
         # Time validation
-        try:
-            start_time = datetime.fromisoformat(block['start'])
-            end_time = datetime.fromisoformat(block['end'])
-            
-            if start_time >= end_time:
-                errors.append("Start time must be before end time")
-        except (ValueError, KeyError):
+        start_time = _parse_iso(block.get('start', ''))
+        end_time = _parse_iso(block.get('end', ''))
+        if start_time is None or end_time is None:
             errors.append("Invalid time format")
+        elif start_time >= end_time:
+            errors.append("Start time must be before end time")
         
         return errors
 
@@ -294,8 +424,8 @@ class FileUtils:
     def read_json_file(file_path: str) -> Optional[Dict[str, Any]]:
         """Read JSON file safely."""
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return safe_json_loads(f.read())
         except Exception:
             return None
     
@@ -307,7 +437,7 @@ class FileUtils:
             FileUtils.ensure_directory_exists(os.path.dirname(file_path))
             
             with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.write(safe_json_dumps(data, indent=2))
             return True
         except Exception:
             return False
\ No newline at end of file
@@ -7,9 +7,14 @@ import json
 from datetime import datetime, date
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles datetime objects."""
-    
+
     def default(self, obj: Any) -> Any:
         """Convert datetime objects to ISO format strings."""
         if isinstance(obj, datetime):
@@ -18,15 +23,49 @@ class DateTimeEncoder(json.JSONEncoder):
             return obj.isoformat()
         return super().default(obj)
 
+def _fallback_default(obj: Any) -> Any:
+    """Convert objects orjson can't serialize natively."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def safe_json_dumps(obj: Any, **kwargs) -> str:
     """
     JSON dumps with datetime handling.
-    
+
+    Uses the C-backed orjson encoder when available (it serializes datetime
+    natively), falling back to stdlib json with DateTimeEncoder otherwise.
+
     Args:
         obj: Object to serialize
         **kwargs: Additional arguments for json.dumps
-        
+
     Returns:
         JSON string with datetime objects properly serialized
     """
-    return json.dumps(obj, cls=DateTimeEncoder, **kwargs)
\ No newline at end of file
+    if orjson is not None and set(kwargs) <= {'indent'}:
+        option = orjson.OPT_INDENT_2 if kwargs.get('indent') else 0
+        return orjson.dumps(obj, default=_fallback_default, option=option).decode()
+    if not kwargs.get('indent'):
+        kwargs.setdefault('separators', (',', ':'))
+    return json.dumps(obj, cls=DateTimeEncoder, **kwargs)
+
+def safe_json_loads(data: Any) -> Any:
+    """
+    JSON loads on the fastest available parser.
+
+    Uses orjson when available (accepts str or bytes), falling back to
+    stdlib json otherwise.
+
+    Args:
+        data: JSON string or bytes to parse
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        # stdlib json takes str/bytes only; orjson reads buffers directly
+        data = data.tobytes()
+    return json.loads(data)